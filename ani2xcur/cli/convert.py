@@ -8,10 +8,6 @@ from typing import Annotated
 import typer
 import click
 
-from ani2xcur.cursor_conversion.convert import (
-    win_cursor_to_x11,
-    x11_cursor_to_win,
-)
 from ani2xcur.cursor_conversion.win2xcur_warp import (
     Win2xcurArgs,
     X2wincurArgs,
@@ -31,10 +27,7 @@ from ani2xcur.file_operations.archive_manager import (
     create_archive,
     SUPPORTED_ARCHIVE_FORMAT,
 )
-from ani2xcur.manager.image_magick_manager import check_image_magick_is_installed
 from ani2xcur.utils import is_http_or_https
-from ani2xcur.manager.linux_cur_manager import install_linux_cursor
-from ani2xcur.manager.win_cur_manager import install_windows_cursor
 from ani2xcur.manager.base import (
     WINDOWS_USER_CURSOR_PATH,
     LINUX_USER_ICONS_PATH,
@@ -139,6 +132,10 @@ def win2xcur(
     ] = None,
 ) -> None:
     """将 Windows 鼠标指针文件包转换为 Linux 鼠标指针文件包"""
+    # 转换和安装模块会导入各平台的鼠标指针管理模块, 仅在执行命令时导入以减少 CLI 的启动耗时
+    from ani2xcur.cursor_conversion.convert import win_cursor_to_x11  # pylint: disable=import-outside-toplevel
+    from ani2xcur.manager.image_magick_manager import check_image_magick_is_installed  # pylint: disable=import-outside-toplevel
+
     if not check_image_magick_is_installed():
         logger.error("未安装 ImageMagick, 无法进行鼠标指针转换, 请使用 ani2xcur imagemagick install 命令进行安装")
         sys.exit(1)
@@ -184,6 +181,8 @@ def win2xcur(
 
         if install:
             if sys.platform == "linux":
+                from ani2xcur.manager.linux_cur_manager import install_linux_cursor  # pylint: disable=import-outside-toplevel
+
                 logger.info("将 '%s' 鼠标指针安装到 Linux 系统中", save_path)
                 desktop_entry_file = find_desktop_entry_file(
                     input_file=save_path,
@@ -256,6 +255,10 @@ def x2wincur(
     ] = None,
 ) -> None:
     """将 Linux 鼠标指针文件包转换为 Windows 鼠标指针文件包"""
+    # 转换和安装模块会导入各平台的鼠标指针管理模块, 仅在执行命令时导入以减少 CLI 的启动耗时
+    from ani2xcur.cursor_conversion.convert import x11_cursor_to_win  # pylint: disable=import-outside-toplevel
+    from ani2xcur.manager.image_magick_manager import check_image_magick_is_installed  # pylint: disable=import-outside-toplevel
+
     if not check_image_magick_is_installed():
         logger.error("未安装 ImageMagick, 无法进行鼠标指针转换, 请使用 ani2xcur imagemagick install 命令进行安装")
         sys.exit(1)
@@ -297,6 +300,8 @@ def x2wincur(
 
         if install:
             if sys.platform == "win32":
+                from ani2xcur.manager.win_cur_manager import install_windows_cursor  # pylint: disable=import-outside-toplevel
+
                 logger.info("将 '%s' 鼠标指针安装到 Windows 系统中", save_path)
                 desktop_entry_file = find_inf_file(
                     input_file=save_path,
@@ -2,40 +2,24 @@
 
 import sys
 import traceback
+from functools import cache
 from typing import (
     Annotated,
     Any,
+    Callable,
+    TypedDict,
 )
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import typer
 import click
-from rich.console import Console
-from rich.table import Table
-from rich import box
 
 from ani2xcur.manager.base import (
     WINDOWS_USER_CURSOR_PATH,
     LINUX_USER_ICONS_PATH,
-)
-from ani2xcur.manager.win_cur_manager import (
-    install_windows_cursor,
-    delete_windows_cursor,
-    export_windows_cursor,
-    set_windows_cursor_theme,
-    set_windows_cursor_size,
-    list_windows_cursors,
-    get_windows_cursor_info,
-)
-from ani2xcur.manager.linux_cur_manager import (
-    install_linux_cursor,
-    delete_linux_cursor,
-    export_linux_cursor,
-    set_linux_cursor_theme,
-    set_linux_cursor_size,
-    list_linux_cursors,
-    get_linux_cursor_info,
+    CursorSchemesList,
+    CurrentCursorInfoList,
 )
 from ani2xcur.config import (
     LOGGER_NAME,
@@ -60,6 +44,108 @@ logger = get_logger(
 )
 
 
+class CursorManagerBackend(TypedDict):
+    """当前平台的鼠标指针管理后端"""
+
+    platform: str
+    """平台标识, 与 sys.platform 一致"""
+
+    platform_name: str
+    """平台显示名称"""
+
+    privilege_name: str
+    """平台提升权限的名称"""
+
+    install_cursor: Callable[..., Any]
+    """安装鼠标指针的函数"""
+
+    delete_cursor: Callable[[str], None]
+    """删除鼠标指针的函数"""
+
+    export_cursor: Callable[..., Path]
+    """导出鼠标指针的函数"""
+
+    set_cursor_theme: Callable[[str], None]
+    """设置鼠标指针主题的函数"""
+
+    set_cursor_size: Callable[[int], None]
+    """设置鼠标指针大小的函数"""
+
+    list_cursors: Callable[[], CursorSchemesList]
+    """列出已安装鼠标指针的函数"""
+
+    get_cursor_info: Callable[[], CurrentCursorInfoList]
+    """获取当前鼠标指针信息的函数"""
+
+
+def _load_windows_backend() -> CursorManagerBackend:
+    """加载 Windows 平台的鼠标指针管理后端
+
+    Returns:
+        CursorManagerBackend: Windows 平台的鼠标指针管理后端
+    """
+    from ani2xcur.manager import win_cur_manager  # pylint: disable=import-outside-toplevel
+
+    return {
+        "platform": "win32",
+        "platform_name": "Windows",
+        "privilege_name": "管理员",
+        "install_cursor": win_cur_manager.install_windows_cursor,
+        "delete_cursor": win_cur_manager.delete_windows_cursor,
+        "export_cursor": win_cur_manager.export_windows_cursor,
+        "set_cursor_theme": win_cur_manager.set_windows_cursor_theme,
+        "set_cursor_size": win_cur_manager.set_windows_cursor_size,
+        "list_cursors": win_cur_manager.list_windows_cursors,
+        "get_cursor_info": win_cur_manager.get_windows_cursor_info,
+    }
+
+
+def _load_linux_backend() -> CursorManagerBackend:
+    """加载 Linux 平台的鼠标指针管理后端
+
+    Returns:
+        CursorManagerBackend: Linux 平台的鼠标指针管理后端
+    """
+    from ani2xcur.manager import linux_cur_manager  # pylint: disable=import-outside-toplevel
+
+    return {
+        "platform": "linux",
+        "platform_name": "Linux",
+        "privilege_name": "root",
+        "install_cursor": linux_cur_manager.install_linux_cursor,
+        "delete_cursor": linux_cur_manager.delete_linux_cursor,
+        "export_cursor": linux_cur_manager.export_linux_cursor,
+        "set_cursor_theme": linux_cur_manager.set_linux_cursor_theme,
+        "set_cursor_size": linux_cur_manager.set_linux_cursor_size,
+        "list_cursors": linux_cur_manager.list_linux_cursors,
+        "get_cursor_info": linux_cur_manager.get_linux_cursor_info,
+    }
+
+
+CURSOR_MANAGER_BACKEND_LOADERS: dict[str, Callable[[], CursorManagerBackend]] = {
+    "win32": _load_windows_backend,
+    "linux": _load_linux_backend,
+}
+"""各平台鼠标指针管理后端的加载函数"""
+
+_cursor_backend_loader = CURSOR_MANAGER_BACKEND_LOADERS.get(sys.platform)
+"""当前平台鼠标指针管理后端的加载函数, 在模块导入时确定"""
+
+
+@cache
+def get_cursor_backend() -> CursorManagerBackend:
+    """获取当前平台的鼠标指针管理后端, 后端模块仅在首次调用时导入
+
+    Returns:
+        CursorManagerBackend: 当前平台的鼠标指针管理后端
+    """
+    if _cursor_backend_loader is None:
+        logger.error("不支持的系统: %s", sys.platform)
+        sys.exit(1)
+
+    return _cursor_backend_loader()
+
+
 def install_cursor(
     input_path: Annotated[
         Path,
@@ -83,7 +169,8 @@ def install_cursor(
     ] = False,
 ) -> None:
     """将鼠标指针安装到系统中"""
-    if sys.platform == "win32":
+    backend = get_cursor_backend()
+    if backend["platform"] == "win32":
         if install_path is None:
             if use_inf_config_path:
                 logger.info("使用 INF 配置文件中的鼠标指针安装路径")
@@ -106,7 +193,7 @@ def install_cursor(
                 sys.exit(1)
 
             try:
-                install_windows_cursor(
+                backend["install_cursor"](
                     inf_file=inf_file,
                     cursor_install_path=install_path,
                 )
@@ -116,7 +203,7 @@ def install_cursor(
                     "在 Windows 系统上安装鼠标指针时发生错误: '%s'\n请检查是否使用管理员权限运行 Ani2xcur 运行, 或者尝试使用 --install-path 参数指定其他鼠标指针的安装路径", e
                 )
                 sys.exit(1)
-    elif sys.platform == "linux":
+    else:
         if install_path is None:
             install_path = LINUX_USER_ICONS_PATH
             logger.info("未指定鼠标指针安装路径, 使用默认鼠标指针安装路径: '%s'", install_path)
@@ -141,20 +228,17 @@ def install_cursor(
                 sys.exit(1)
 
             try:
-                install_linux_cursor(
+                backend["install_cursor"](
                     desktop_entry_file=desktop_entry_file,
                     cursor_install_path=install_path,
                 )
             except (FileNotFoundError, RuntimeError) as e:
                 traceback.print_exc()
                 logger.error(
-                    "在 Windows 系统上安装鼠标指针时发生错误: %s\n请检查是否使用管理员权限运行 Ani2xcur 运行, 或者尝试使用 --install-path 参数指定其他鼠标指针的安装路径\n鼠标指针文件可能也出现损坏, 也请检查鼠标指针文件的完整性",
+                    "在 Linux 系统上安装鼠标指针时发生错误: %s\n请检查是否使用 root 权限运行 Ani2xcur 运行, 或者尝试使用 --install-path 参数指定其他鼠标指针的安装路径\n鼠标指针文件可能也出现损坏, 也请检查鼠标指针文件的完整性",
                     e,
                 )
                 sys.exit(1)
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
-        sys.exit(1)
 
 
 def uninstall_cursor(
@@ -174,36 +258,19 @@ def uninstall_cursor(
     ] = False,
 ) -> None:
     """删除系统中指定的鼠标指针"""
-    if sys.platform == "win32":
-        if not force:
-            typer.confirm(f"确认删除 {cursor_name} 鼠标指针吗?", abort=True)
-
-        try:
-            delete_windows_cursor(cursor_name)
-        except RuntimeError as e:
-            traceback.print_exc()
-            logger.error("删除鼠标指针时发生错误: %s\n可能为没有权限进行删除鼠标指针文件, 可尝试使用管理员权限运行 Ani2xcur", e)
-            sys.exit(1)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("删除鼠标指针时发生错误: %s\n请检查要删除的鼠标指针是否存在或者正在使用", e)
-            sys.exit(1)
-    elif sys.platform == "linux":
-        if not force:
-            typer.confirm(f"确认删除 {cursor_name} 鼠标指针吗?", abort=True)
-
-        try:
-            delete_linux_cursor(cursor_name)
-        except RuntimeError as e:
-            traceback.print_exc()
-            logger.error("删除鼠标指针时发生错误: %s\n可能为没有权限进行删除鼠标指针文件, 可尝试使用 root 权限运行 Ani2xcur", e)
-            sys.exit(1)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("删除鼠标指针时发生错误: %s\n请检查要删除的鼠标指针是否存在", e)
-            sys.exit(1)
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
+    backend = get_cursor_backend()
+    if not force:
+        typer.confirm(f"确认删除 {cursor_name} 鼠标指针吗?", abort=True)
+
+    try:
+        backend["delete_cursor"](cursor_name)
+    except RuntimeError as e:
+        traceback.print_exc()
+        logger.error("删除鼠标指针时发生错误: %s\n可能为没有权限进行删除鼠标指针文件, 可尝试使用%s权限运行 Ani2xcur", e, backend["privilege_name"])
+        sys.exit(1)
+    except ValueError as e:
+        traceback.print_exc()
+        logger.error("删除鼠标指针时发生错误: %s\n请检查要删除的鼠标指针是否存在或者正在使用", e)
         sys.exit(1)
 
 
@@ -243,52 +310,30 @@ def export_cursor(
     ] = ".zip",
 ) -> None:
     """将鼠标指针从系统中导出"""
-    if sys.platform == "win32":
-        try:
-            path = export_windows_cursor(
-                cursor_name=cursor_name,
-                output_path=output_path,
-                custom_install_path=custom_install_path,
-            )
-            logger.info("Windows 鼠标指针导出完成, 导出路径: '%s'", path)
-            if compress:
-                logger.info("将 Windows 鼠标指针进行打包")
-                archive_path = output_path / f"{path.name}{compress_format}"
-                create_archive(
-                    sources=[path],
-                    archive_path=archive_path,
-                )
-                logger.info("Windows 鼠标指针打包完成, 保存路径: '%s'", archive_path)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("导出鼠标指针发生错误: %s\n请检查导出的鼠标指针是否存在于系统中", e)
-            sys.exit(1)
-    elif sys.platform == "linux":
-        try:
-            path = export_linux_cursor(
-                cursor_name=cursor_name,
-                output_path=output_path,
-                custom_install_path=custom_install_path,
+    backend = get_cursor_backend()
+    platform_name = backend["platform_name"]
+    try:
+        path = backend["export_cursor"](
+            cursor_name=cursor_name,
+            output_path=output_path,
+            custom_install_path=custom_install_path,
+        )
+        logger.info("%s 鼠标指针导出完成, 导出路径: '%s'", platform_name, path)
+        if compress:
+            logger.info("将 %s 鼠标指针进行打包", platform_name)
+            archive_path = output_path / f"{path.name}{compress_format}"
+            create_archive(
+                sources=[path],
+                archive_path=archive_path,
             )
-            logger.info("Linux 鼠标指针导出完成, 导出路径: '%s'", path)
-            if compress:
-                logger.info("将 Linux 鼠标指针进行打包")
-                archive_path = output_path / f"{path.name}{compress_format}"
-                create_archive(
-                    sources=[path],
-                    archive_path=archive_path,
-                )
-                logger.info("Linux 鼠标指针打包完成, 保存路径: '%s'", archive_path)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("导出鼠标指针发生错误: %s\n请检查导出的鼠标指针是否存在于系统中", e)
-            sys.exit(1)
-        except RuntimeError as e:
-            traceback.print_exc()
-            logger.error("导出鼠标指针发生错误: %s\n可能为导出路径无权限读写, 可尝试修改导出路径进行尝试, 或者使用 root 权限运行 Ani2xcur", e)
-            sys.exit(1)
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
+            logger.info("%s 鼠标指针打包完成, 保存路径: '%s'", platform_name, archive_path)
+    except ValueError as e:
+        traceback.print_exc()
+        logger.error("导出鼠标指针发生错误: %s\n请检查导出的鼠标指针是否存在于系统中", e)
+        sys.exit(1)
+    except RuntimeError as e:
+        traceback.print_exc()
+        logger.error("导出鼠标指针发生错误: %s\n可能为导出路径无权限读写, 可尝试修改导出路径进行尝试, 或者使用%s权限运行 Ani2xcur", e, backend["privilege_name"])
         sys.exit(1)
 
 
@@ -301,22 +346,12 @@ def set_cursor_theme(
     ],
 ) -> None:
     """设置系统要使用的鼠标指针主题"""
-    if sys.platform == "win32":
-        try:
-            set_windows_cursor_theme(cursor_name)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针主题时发生错误: %s\n请检查要设置的鼠标指针主题是否安装到系统中", e)
-            sys.exit(1)
-    elif sys.platform == "linux":
-        try:
-            set_linux_cursor_theme(cursor_name)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针主题时发生错误: %s\n请检查要设置的鼠标指针主题是否安装到系统中", e)
-            sys.exit(1)
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
+    backend = get_cursor_backend()
+    try:
+        backend["set_cursor_theme"](cursor_name)
+    except ValueError as e:
+        traceback.print_exc()
+        logger.error("设置鼠标指针主题时发生错误: %s\n请检查要设置的鼠标指针主题是否安装到系统中", e)
         sys.exit(1)
 
 
@@ -329,30 +364,16 @@ def set_cursor_size(
     ],
 ) -> None:
     """设置系统要使用的鼠标指针大小"""
-    if sys.platform == "win32":
-        try:
-            set_windows_cursor_size(cursor_size)
-        except TypeError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的是否为整数", e)
-            sys.exit(1)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的值是否在合法范围", e)
-            sys.exit(1)
-    elif sys.platform == "linux":
-        try:
-            set_linux_cursor_size(cursor_size)
-        except TypeError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的是否为整数", e)
-            sys.exit(1)
-        except ValueError as e:
-            traceback.print_exc()
-            logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的值是否在合法范围", e)
-            sys.exit(1)
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
+    backend = get_cursor_backend()
+    try:
+        backend["set_cursor_size"](cursor_size)
+    except TypeError as e:
+        traceback.print_exc()
+        logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的是否为整数", e)
+        sys.exit(1)
+    except ValueError as e:
+        traceback.print_exc()
+        logger.error("设置鼠标指针大小时发生错误: %s\n请检查鼠标指针大小的值是否在合法范围", e)
         sys.exit(1)
 
 
@@ -362,6 +383,10 @@ def list_cursor() -> None:
     def _display_frame(
         items: list[dict[str, Any]],
     ) -> None:
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+        from rich import box  # pylint: disable=import-outside-toplevel
+
         console = Console()
 
         # 设置表格整体样式
@@ -385,15 +410,9 @@ def list_cursor() -> None:
 
         console.print(table)
 
-    if sys.platform == "win32":
-        logger.info("获取 Windows 系统中已安装的鼠标指针列表")
-        cursors = list_windows_cursors()
-    elif sys.platform == "linux":
-        logger.info("获取 Linux 系统中已安装的鼠标指针列表")
-        cursors = list_linux_cursors()
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
-        sys.exit(1)
+    backend = get_cursor_backend()
+    logger.info("获取 %s 系统中已安装的鼠标指针列表", backend["platform_name"])
+    cursors = backend["list_cursors"]()
 
     _display_frame(cursors)
 
@@ -404,6 +423,10 @@ def get_current_cursor() -> None:
     def _display_frame(
         items: list[dict[str, Any]],
     ) -> None:
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+        from rich import box  # pylint: disable=import-outside-toplevel
+
         console = Console()
 
         # 设置表格整体样式
@@ -428,12 +451,6 @@ def get_current_cursor() -> None:
 
         console.print(table)
 
-    if sys.platform == "win32":
-        info = get_windows_cursor_info()
-    elif sys.platform == "linux":
-        info = get_linux_cursor_info()
-    else:
-        logger.error("不支持的系统: %s", sys.platform)
-        sys.exit(1)
+    info = get_cursor_backend()["get_cursor_info"]()
 
     _display_frame(info)
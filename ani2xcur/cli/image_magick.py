@@ -14,12 +14,6 @@ from ani2xcur.config import (
     IMAGE_MAGICK_WINDOWS_INSTALL_PATH,
 )
 from ani2xcur.logger import get_logger
-from ani2xcur.manager.image_magick_manager import (
-    install_image_magick_windows,
-    install_image_magick_linux,
-    uninstall_image_magick_windows,
-    uninstall_image_magick_linux,
-)
 from ani2xcur.utils import (
     is_admin_on_windows,
     is_root_on_linux,
@@ -63,6 +57,8 @@ def install_image_magick(
 
         if not force:
             typer.confirm("确认安装 ImageMagick 吗?", abort=True)
+        from ani2xcur.manager.image_magick_manager import install_image_magick_windows  # pylint: disable=import-outside-toplevel
+
         try:
             install_image_magick_windows(install_path=install_path)
         except PermissionError as e:
@@ -77,6 +73,8 @@ def install_image_magick(
         if not force:
             typer.confirm("确认安装 ImageMagick 吗?", abort=True)
 
+        from ani2xcur.manager.image_magick_manager import install_image_magick_linux  # pylint: disable=import-outside-toplevel
+
         try:
             install_image_magick_linux()
         except RuntimeError as e:
@@ -108,11 +106,13 @@ def uninstall_image_magick(
         if not force:
             typer.confirm("确认卸载 ImageMagick 吗?", abort=True)
 
+        from ani2xcur.manager.image_magick_manager import uninstall_image_magick_windows  # pylint: disable=import-outside-toplevel
+
         try:
             uninstall_image_magick_windows()
         except PermissionError as e:
             traceback.print_exc()
-            logger.error("安装 ImageMagick 时发生错误: %s\n请检查是否使用管理员权限运行 Ani2xcur", e)
+            logger.error("卸载 ImageMagick 时发生错误: %s\n请检查是否使用管理员权限运行 Ani2xcur", e)
             sys.exit(1)
     elif sys.platform == "linux":
         if not is_root_on_linux():
@@ -122,11 +122,13 @@ def uninstall_image_magick(
         if not force:
             typer.confirm("确认卸载 ImageMagick 吗?", abort=True)
 
+        from ani2xcur.manager.image_magick_manager import uninstall_image_magick_linux  # pylint: disable=import-outside-toplevel
+
         try:
             uninstall_image_magick_linux()
         except RuntimeError as e:
             traceback.print_exc()
-            logger.error("安装 ImageMagick 时发生错误: %s\n当前的 Linux 发行版可能不支持自动安装 ImageMagick, 请尝试手动安装 ImageMagick", e)
+            logger.error("卸载 ImageMagick 时发生错误: %s\n当前的 Linux 发行版可能不支持自动卸载 ImageMagick, 请尝试手动卸载 ImageMagick", e)
             sys.exit(1)
     else:
         logger.error("不支持的系统: %s", sys.platform)
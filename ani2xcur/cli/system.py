@@ -9,9 +9,6 @@ from typing import (
 )
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich import box
 
 from ani2xcur.config import (
     LOGGER_NAME,
@@ -32,6 +29,9 @@ logger = get_logger(
     color=LOGGER_COLOR,
 )
 
+PACKAGE_NAME_PATTERN = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+"""匹配依赖声明开头的 Python 软件包名 (PEP 508)"""
+
 
 def update(
     install_from_source: Annotated[
@@ -77,6 +77,11 @@ def version() -> None:
     def _display_frame(
         items: list[dict[str, Any]],
     ) -> None:
+        # rich 仅用于显示表格, 在需要时再导入以减少 CLI 的启动耗时
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+        from rich import box  # pylint: disable=import-outside-toplevel
+
         console = Console()
 
         # 设置表格整体样式
@@ -99,10 +104,9 @@ def version() -> None:
 
         console.print(table)
 
-    requires = importlib.metadata.requires("ani2xcur")
-    requires.insert(0, "ani2xcur")
+    requires = ["ani2xcur"] + (importlib.metadata.requires("ani2xcur") or [])
     info: list[dict[str, str | None]] = []
-    pkgs = [remove_optional_dependence_from_package(get_package_name(x)).split(";")[0].strip() for x in requires]
+    pkgs = [get_package_name(x) for x in requires]
     for pkg in pkgs:
         try:
             ver = importlib.metadata.version(pkg)
@@ -114,29 +118,17 @@ def version() -> None:
 
 
 def get_package_name(
-    package: str,
-) -> str:
-    """获取 Python 软件包的包名, 去除末尾的版本声明
-
-    Args:
-        package (str): Python 软件包名
-    Returns:
-        str: 返回去除版本声明后的 Python 软件包名
-    """
-    return package.split("===")[0].split("~=")[0].split("!=")[0].split("<=")[0].split(">=")[0].split("<")[0].split(">")[0].split("==")[0].strip()
-
-
-def remove_optional_dependence_from_package(
-    filename: str,
+    requirement: str,
 ) -> str:
-    """移除 Python 软件包声明中可选依赖
+    """从 Python 软件包的依赖声明中获取包名, 去除可选依赖, 版本声明和环境标记
 
     Args:
-        filename (str): Python 软件包名
+        requirement (str): Python 软件包的依赖声明, e.g. diffusers[torch]==0.10.2; python_version >= "3.10"
     Returns:
-        str: 移除可选依赖后的软件包名, e.g. diffusers[torch]==0.10.2 -> diffusers==0.10.2
+        str: 返回 Python 软件包名, e.g. diffusers
     """
-    return re.sub(r"\[.*?\]", "", filename)
+    match = PACKAGE_NAME_PATTERN.match(requirement)
+    return match.group(1) if match is not None else requirement.strip()
 
 
 def env() -> None:
@@ -145,6 +137,11 @@ def env() -> None:
     def _display_frame(
         items: list[dict[str, Any]],
     ) -> None:
+        # rich 仅用于显示表格, 在需要时再导入以减少 CLI 的启动耗时
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+        from rich import box  # pylint: disable=import-outside-toplevel
+
         console = Console()
 
         # 设置表格整体样式
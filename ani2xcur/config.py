@@ -35,3 +35,6 @@ WIN2XCUR_REPOSITORY_URL = os.getenv("WIN2XCUR_REPOSITORY_URL", "https://github.c
 
 SMART_FINDER_SEARCH_DEPTH = int(os.getenv("ANI2XCUR_SMART_FINDER_SEARCH_DEPTH", "3"))
 """Ani2xcur 智能搜索鼠标指针配置文件的深度"""
+
+ARCHIVE_CACHE_PATH = Path(os.environ["ANI2XCUR_ARCHIVE_CACHE_PATH"]) if os.getenv("ANI2XCUR_ARCHIVE_CACHE_PATH") else None
+"""智能搜索时压缩包解压结果的持久化缓存目录, 未设置时解压到临时目录中"""
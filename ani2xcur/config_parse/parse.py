@@ -34,6 +34,12 @@ class INFSection(TypedDict, total=False):
 ParsedINF: TypeAlias = dict[str, INFSection]  # pylint: disable=invalid-name
 """parsed INF 的类型"""
 
+SECTION_HEADER_PATTERN = re.compile(r"^\[(.+?)\]$")
+"""匹配节标题行 (如 `[Icon Theme]`) 的正则表达式"""
+
+VALUE_COMMA_SPLIT_PATTERN = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+"""按逗号分割变量值且不拆分引号内逗号的正则表达式"""
+
 
 def parse_inf_text(
     text: str,
@@ -52,10 +58,10 @@ def parse_inf_text(
         line = raw.strip()
         if not line:
             continue
-        if line.startswith(";") or line.startswith("//") or set(line) <= {"/"}:
+        if line.startswith((";", "//")) or not line.strip("/"):
             continue
 
-        m = re.match(r"^\[(.+?)\]$", line)
+        m = SECTION_HEADER_PATTERN.match(line)
         if m:
             current = m.group(1)
             result[current] = cast(INFSection, {"var": {}, "constant": []})
@@ -75,7 +81,7 @@ def parse_inf_text(
                 val = rhs_raw[1:-1]
             else:
                 # 按逗号分割, 但避免拆分引号内的逗号 (使用正则)
-                parts = [p.strip() for p in re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', rhs_raw)]
+                parts = [p.strip() for p in VALUE_COMMA_SPLIT_PATTERN.split(rhs_raw)]
                 # 如果只有一项则返回字符串, 否则返回列表
                 # 注意: 不去掉内部项的引号 (除非整体被引号包裹)
                 val = parts[0] if len(parts) == 1 else parts
@@ -1,8 +1,16 @@
 """鼠标指针包转换工具"""
 
 import os
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import (
+    Any,
+    Callable,
+)
 
 from tqdm import tqdm
 
@@ -12,7 +20,7 @@ from ani2xcur.manager.win_cur_manager import (
     extract_scheme_info_from_inf,
     generate_cursor_scheme_inf_string,
 )
-from ani2xcur.manager.base import CURSOR_KEYS
+from ani2xcur.manager.base import CURSOR_KEY_PAIRS
 from ani2xcur.manager.linux_cur_manager import (
     extract_scheme_info_from_desktop_entry,
     generate_install_script,
@@ -32,7 +40,7 @@ from ani2xcur.cursor_conversion.win2xcur_warp import (
 )
 from ani2xcur.file_operations.file_manager import (
     copy_files,
-    save_create_symlink,
+    save_create_symlinks,
 )
 
 logger = get_logger(
@@ -64,7 +72,8 @@ def win_cursor_to_x11(
     completed_cursor_list: list[tuple[str, Path]] = []
     link_file_list: list[tuple[Path, Path]] = []
 
-    with TemporaryDirectory() as tmp_dir:
+    output_path.mkdir(parents=True, exist_ok=True)
+    with make_scratch_dir(output_path) as tmp_dir:
         tmp_dir = Path(tmp_dir)
 
         # 创建 cursors 文件夹用于存放鼠标指针
@@ -74,8 +83,8 @@ def win_cursor_to_x11(
         logger.info("配置 '%s' 鼠标指针的转换参数", cursor_name)
 
         # 生成要进行鼠标指针的转换列表
-        for win, linux in zip(CURSOR_KEYS["win"], CURSOR_KEYS["linux"]):
-            src = cursor_map[win]["src_path"]
+        for win, linux in CURSOR_KEY_PAIRS:
+            src = cursor_map[win].src_path
             dst = cursors_dir / linux
             if src is None:
                 # 使用补全文件
@@ -103,26 +112,36 @@ def win_cursor_to_x11(
 
         # 转换鼠标指针文件
         logger.debug("要进行转换的鼠标指针列表: %s", win2x_path_list)
-        for name, src, dst in tqdm(win2x_path_list, desc="转换鼠标指针文件"):
-            win2x_args["input_file"] = src
-            win2x_args["output_path"] = cursors_dir
-            win2x_args["save_name"] = name
-            logger.debug("调用 win2xcur 使用的参数: %s", win2x_args)
-            win2xcur_process(**win2x_args)
+        # 每个任务使用独立的参数字典, 避免任务之间共享可变状态
+        win2x_tasks: list[Win2xcurArgs] = [
+            {
+                **win2x_args,
+                "input_file": src,
+                "output_path": cursors_dir,
+                "save_name": name,
+            }
+            for name, src, _ in win2x_path_list
+        ]
+        logger.debug("调用 win2xcur 使用的参数: %s", win2x_tasks)
+        run_conversion_tasks(
+            process=win2xcur_process,
+            tasks=win2x_tasks,
+            desc="转换鼠标指针文件",
+        )
 
         # 补全鼠标指针文件
         logger.debug("要进行补全的鼠标指针列表: %s", completed_cursor_list)
         for src, dst in tqdm(completed_cursor_list, desc="补全鼠标指针文件"):
+            # 补全文件会随鼠标指针包一同导出, 必须复制而不能与软件包内置的文件共享硬链接,
+            # 否则之后合并写入输出目录时会改动内置的补全文件
             copy_files(src, dst)
 
-        # 创建链接文件
-        current_path = Path().absolute()
-        os.chdir(cursors_dir)
+        # 创建链接文件, 链接目标使用相对路径, 所有链接均相对于 cursors 文件夹创建, 无需切换工作目录
         logger.debug("要进行链接的鼠标指针别名: %s", link_file_list)
-        for s, v in tqdm(link_file_list, desc="链接鼠标指针别名"):
-            save_create_symlink(s, v)
-
-        os.chdir(current_path)
+        save_create_symlinks(
+            directory=cursors_dir,
+            links=tqdm(link_file_list, desc="链接鼠标指针别名"),
+        )
 
         # 创建配置文件
         generate_linux_cursor_config(
@@ -139,11 +158,90 @@ def win_cursor_to_x11(
         save_dir = output_path / cursor_name
 
         # 导出文件到输出文件夹
-        copy_files((tmp_dir / cursor_name), save_dir)
+        export_to_output(tmp_dir / cursor_name, save_dir)
 
     return save_dir
 
 
+def make_scratch_dir(
+    output_path: Path,
+) -> TemporaryDirectory:
+    """创建转换鼠标指针时使用的临时目录
+
+    临时目录建立在输出目录旁 (输出目录的父目录中), 通常与输出目录处于同一文件系统, 转换完成后可直接重命名,
+    且不会出现在输出目录中 (如 `~/.icons`), 异常退出时残留的临时目录不会被当作鼠标指针主题; 无法在该位置创建时使用系统临时目录
+
+    Args:
+        output_path (Path): 导出路径
+    Returns:
+        TemporaryDirectory: 临时目录对象
+    """
+    try:
+        return TemporaryDirectory(dir=output_path.absolute().parent, prefix=".ani2xcur-")
+    except OSError as e:
+        logger.debug("无法在 '%s' 旁创建临时目录, 使用系统临时目录: %s", output_path, e)
+        return TemporaryDirectory(prefix="ani2xcur-")
+
+
+def run_conversion_tasks(
+    process: Callable[..., Any],
+    tasks: list[dict[str, Any]],
+    desc: str,
+) -> list[Any]:
+    """使用多进程并行执行鼠标指针转换任务
+
+    Args:
+        process (Callable[..., Any]): 转换函数, 需要为模块级函数以便在子进程中调用
+        tasks (list[dict[str, Any]]): 每个转换任务的参数字典
+        desc (str): 进度条描述
+    Returns:
+        list[Any]: 与任务顺序一致的转换结果列表
+    Raises:
+        Exception: 任意转换任务失败时抛出该任务的异常
+    """
+    if not tasks:
+        return []
+
+    results: list[Any] = [None] * len(tasks)
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(process, **task): i for i, task in enumerate(tasks)}
+        try:
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+                results[futures[future]] = future.result()
+        except Exception:
+            # 任意任务失败时取消尚未开始的任务
+            for future in futures:
+                future.cancel()
+            raise
+
+    return results
+
+
+def export_to_output(
+    src: Path,
+    dst: Path,
+) -> None:
+    """将转换完成的鼠标指针包导出到输出路径
+
+    当输出路径不存在时直接重命名, 避免再次读写所有文件; 否则与已有的文件合并
+
+    Args:
+        src (Path): 转换完成的鼠标指针包路径
+        dst (Path): 导出路径
+    """
+    if not dst.exists():
+        try:
+            os.replace(src, dst)
+            return
+        except OSError as e:
+            # 临时目录与输出路径不在同一文件系统时无法重命名, 改为复制
+            logger.debug("无法将 '%s' 重命名为 '%s', 改为复制: %s", src, dst, e)
+
+    # 源路径为即将删除的临时目录, 可以安全地使用硬链接代替复制
+    copy_files(src, dst, hardlink=True)
+
+
 def generate_linux_cursor_config(
     cursor_name: str,
     cursor_path: Path,
@@ -189,12 +287,13 @@ def x11_cursor_to_win(
     """
     linux_scheme = extract_scheme_info_from_desktop_entry(desktop_entry_file)
     logger.debug("DesktopEntry 鼠标指针配置文件内容: %s", linux_scheme)
-    cursor_map = linux_scheme["cursor_map"]
-    cursor_name = linux_scheme["scheme_name"]
+    cursor_map = linux_scheme.cursor_map
+    cursor_name = linux_scheme.scheme_name
     x2win_path_list: list[tuple[str, Path, Path]] = []
     cursor_save_paths: list[tuple[str, Path | None]] = []
 
-    with TemporaryDirectory() as tmp_dir:
+    output_path.mkdir(parents=True, exist_ok=True)
+    with make_scratch_dir(output_path) as tmp_dir:
         tmp_dir = Path(tmp_dir)
 
         # 创建文件夹用于存放鼠标指针
@@ -204,8 +303,8 @@ def x11_cursor_to_win(
         logger.info("配置 '%s' 鼠标指针的转换参数", cursor_name)
 
         # 生成要进行鼠标指针的转换列表
-        for win, linux in zip(CURSOR_KEYS["win"], CURSOR_KEYS["linux"]):
-            src = cursor_map[win]["src_path"]
+        for win, linux in CURSOR_KEY_PAIRS:
+            src = cursor_map[win].src_path
             dst = cursors_dir / linux
             if src is None:
                 # 使用补全文件
@@ -215,18 +314,27 @@ def x11_cursor_to_win(
 
         # 转换鼠标指针文件
         logger.debug("要进行转换的鼠标指针列表: %s", x2win_path_list)
-        for name, src, dst in tqdm(x2win_path_list, desc="转换鼠标指针文件"):
-            x2win_args["input_file"] = src
-            x2win_args["output_path"] = cursors_dir
-            x2win_args["save_name"] = name
-            logger.debug("调用 x2wincur 的参数: %s", x2win_args)
-            if src is not None:
-                cursor_save_path = x2wincur_process(**x2win_args)
-            else:
-                cursor_save_path = None
-
+        # 每个任务使用独立的参数字典, 避免任务之间共享可变状态
+        x2win_tasks: list[X2wincurArgs] = [
+            {
+                **x2win_args,
+                "input_file": src,
+                "output_path": cursors_dir,
+                "save_name": name,
+            }
+            for name, src, _ in x2win_path_list
+            if src is not None
+        ]
+        logger.debug("调用 x2wincur 的参数: %s", x2win_tasks)
+        results = run_conversion_tasks(
+            process=x2wincur_process,
+            tasks=x2win_tasks,
+            desc="转换鼠标指针文件",
+        )
+        converted = {task["save_name"]: path for task, path in zip(x2win_tasks, results)}
+        for name, src, dst in x2win_path_list:
             logger.debug("添加转换列表: Linux 鼠标指针 `%s` -> Windows 鼠标指针 '%s'", src, dst)
-            cursor_save_paths.append((name, cursor_save_path))
+            cursor_save_paths.append((name, converted.get(name)))
 
         # 创建配置文件
         generate_win_cursor_config(
@@ -238,7 +346,7 @@ def x11_cursor_to_win(
         save_dir = output_path / cursor_name
 
         # 导出文件到输出文件夹
-        copy_files((tmp_dir / cursor_name), save_dir)
+        export_to_output(tmp_dir / cursor_name, save_dir)
 
     return save_dir
 
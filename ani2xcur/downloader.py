@@ -2,10 +2,12 @@
 
 import hashlib
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from urllib.parse import urlparse
 
 from tqdm import tqdm
 
+from ani2xcur.file_operations.archive_manager import extract_archive
 from ani2xcur.logger import get_logger
 from ani2xcur.config import (
     LOGGER_COLOR,
@@ -20,6 +22,9 @@ logger = get_logger(
     color=LOGGER_COLOR,
 )
 
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+"""下载文件时每次读取的数据块大小 (128 KiB)"""
+
 
 def download_file_from_url(
     url: str,
@@ -28,6 +33,7 @@ def download_file_from_url(
     progress: bool | None = True,
     hash_prefix: str | None = None,
     re_download: bool | None = False,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
 ) -> Path:
     """使用 requrests 库下载文件
 
@@ -38,6 +44,7 @@ def download_file_from_url(
         progress (bool | None): 是否启用下载进度条
         hash_prefix (str | None): sha256 十六进制字符串, 如果提供, 将检查下载文件的哈希值是否与此前缀匹配, 当不匹配时引发`ValueError`
         re_download (bool): 强制重新下载文件
+        chunk_size (int): 每次读取的数据块大小
     Returns:
         Path: 下载的文件路径
     Raises:
@@ -68,8 +75,8 @@ def download_file_from_url(
             desc=file_name,
             disable=not progress,
         ) as progress_bar:
-            with open(temp_file, "wb") as file:
-                for chunk in response.iter_content(chunk_size=1024):
+            with open(temp_file, "wb", buffering=chunk_size) as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
                     if chunk:
                         file.write(chunk)
                         progress_bar.update(len(chunk))
@@ -86,6 +93,38 @@ def download_file_from_url(
     return cached_file
 
 
+def download_and_extract_from_url(
+    url: str,
+    extract_to: Path,
+    progress: bool | None = True,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> None:
+    """下载压缩包并解压, 下载的压缩包只保存在临时文件夹中, 解压完成后删除
+
+    压缩包先完整写入磁盘再以可随机访问的方式解压: zip 压缩包的目录位于文件末尾,
+    而 tar 压缩包在无法创建链接时需要回退读取链接目标, 两者都无法从下载流中直接解压
+
+    Args:
+        url (str): 压缩包的下载链接
+        extract_to (Path): 解压到的路径
+        progress (bool | None): 是否启用下载进度条
+        chunk_size (int): 每次读取的数据块大小
+    Raises:
+        ValueError: 压缩包格式不支持解压时
+    """
+    with TemporaryDirectory() as tmp_dir:
+        archive_path = download_file_from_url(
+            url=url,
+            save_path=Path(tmp_dir),
+            progress=progress,
+            chunk_size=chunk_size,
+        )
+        extract_archive(
+            archive_path=archive_path,
+            extract_to=extract_to,
+        )
+
+
 def compare_sha256(
     file_path: str | Path,
     hash_prefix: str,
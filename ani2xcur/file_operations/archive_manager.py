@@ -4,12 +4,12 @@ import os
 import zipfile
 import tarfile
 import lzma
+import tempfile
 from pathlib import Path
-from typing import Iterable
-
-import rarfile
-import zstandard as zstd
-import py7zr
+from typing import (
+    Callable,
+    Iterable,
+)
 
 from ani2xcur.config import (
     LOGGER_NAME,
@@ -41,6 +41,9 @@ SUPPORTED_ARCHIVE_FORMAT = [
 ]
 """支持的压缩包格式列表"""
 
+TAR_COPY_BUFSIZE = 1 << 20
+"""tarfile 解压成员文件时复制数据使用的缓冲区大小 (1 MiB)"""
+
 
 def is_supported_archive_format(
     archive_path: Path,
@@ -59,6 +62,165 @@ def is_supported_archive_format(
     return False
 
 
+def _extract_zip(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 zip 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    with zipfile.ZipFile(archive_path, "r") as zip_ref:
+        zip_ref.extractall(extract_to)
+
+
+def _extract_tar(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar 归档文件
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    with tarfile.open(archive_path, "r", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+        tar_ref.extractall(extract_to)
+
+
+def _extract_tar_gz(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar.gz 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    with tarfile.open(archive_path, "r:gz", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+        tar_ref.extractall(extract_to)
+
+
+def _extract_tar_bz2(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar.bz2 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    with tarfile.open(archive_path, "r:bz2", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+        tar_ref.extractall(extract_to)
+
+
+def _extract_tar_xz(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar.xz 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    with tarfile.open(archive_path, "r:xz", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+        tar_ref.extractall(extract_to)
+
+
+def _extract_tar_lzma(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar.lzma 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    # 外层已经完成解压, 显式指定为未压缩的 tar, 避免 tarfile 探测压缩格式时在解压流中来回定位
+    # 使用可随机访问的模式, 无法创建链接时 tarfile 需要回退读取链接目标
+    with lzma.open(archive_path, "rb") as f:
+        with tarfile.open(fileobj=f, mode="r:", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+            tar_ref.extractall(extract_to)
+
+
+def _extract_tar_zst(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 tar.zst 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    import zstandard as zstd  # pylint: disable=import-outside-toplevel
+
+    # zstd 解压流不支持回退定位, 而无法创建链接时 tarfile 需要回退读取链接目标,
+    # 因此先将 tar 解压到磁盘上的临时文件中再以可随机访问的模式读取
+    with open(archive_path, "rb") as fh, tempfile.TemporaryFile() as tar_file:
+        dctx = zstd.ZstdDecompressor()
+        dctx.copy_stream(fh, tar_file)
+        tar_file.seek(0)
+        with tarfile.open(fileobj=tar_file, mode="r:", copybufsize=TAR_COPY_BUFSIZE) as tar_ref:
+            tar_ref.extractall(extract_to)
+
+
+def _extract_7z(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 7z 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    import py7zr  # pylint: disable=import-outside-toplevel
+
+    with py7zr.SevenZipFile(archive_path, mode="r") as archive:
+        archive.extractall(path=extract_to)
+
+
+def _extract_rar(
+    archive_path: Path,
+    extract_to: Path,
+) -> None:
+    """解压 rar 压缩包
+
+    Args:
+        archive_path (Path): 压缩包路径
+        extract_to (Path): 解压到的路径
+    """
+    import rarfile  # pylint: disable=import-outside-toplevel
+
+    with rarfile.RarFile(archive_path, mode="r") as archive:
+        archive.extractall(path=extract_to)
+
+
+ARCHIVE_EXTRACTORS: dict[str, Callable[[Path, Path], None]] = {
+    ".zip": _extract_zip,
+    ".tar": _extract_tar,
+    ".tar.gz": _extract_tar_gz,
+    ".tar.bz2": _extract_tar_bz2,
+    ".tar.xz": _extract_tar_xz,
+    ".tar.lzma": _extract_tar_lzma,
+    ".tlz": _extract_tar_lzma,
+    ".tar.zst": _extract_tar_zst,
+    ".7z": _extract_7z,
+    ".rar": _extract_rar,
+}
+"""压缩包后缀 (小写) 与解压函数的映射表"""
+
+_EXTRACTOR_SUFFIXES = tuple(sorted(ARCHIVE_EXTRACTORS, key=len, reverse=True))
+"""按长度降序排列的解压后缀, 保证优先匹配最长的后缀"""
+
+
 def extract_archive(
     archive_path: Path,
     extract_to: Path,
@@ -79,53 +241,94 @@ def extract_archive(
 
     logger.info("将 '%s' 解压到 '%s' 中", archive_path, extract_to)
 
-    if name.endswith(".zip"):
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(extract_to)
+    for suffix in _EXTRACTOR_SUFFIXES:
+        if name.endswith(suffix):
+            ARCHIVE_EXTRACTORS[suffix](archive_path, extract_to)
+            return
 
-    if name.endswith(".tar"):
-        with tarfile.open(archive_path, "r") as tar_ref:
-            tar_ref.extractall(extract_to)
-        return
+    logger.warning("暂不支持解压该格式的压缩包: '%s'", archive_path)
 
-    if name.endswith(".tar.gz"):
-        with tarfile.open(archive_path, "r:gz") as tar_ref:
-            tar_ref.extractall(extract_to)
-            return
 
-    if name.endswith(".tar.bz2"):
-        with tarfile.open(archive_path, "r:bz2") as tar_ref:
-            tar_ref.extractall(extract_to)
-        return
+def _list_zip_members(
+    archive_path: Path,
+) -> list[str]:
+    """读取 zip 压缩包的成员列表
 
-    if name.endswith(".tar.xz"):
-        with tarfile.open(archive_path, "r:xz") as tar_ref:
-            tar_ref.extractall(extract_to)
-        return
+    Args:
+        archive_path (Path): 压缩包路径
+    Returns:
+        list[str]: 成员路径列表
+    """
+    with zipfile.ZipFile(archive_path, "r") as zip_ref:
+        return zip_ref.namelist()
 
-    if name.endswith(".tar.lzma") or name.endswith(".tlz"):
-        with lzma.open(archive_path, "rb") as f:
-            with tarfile.open(fileobj=f) as tar_ref:
-                tar_ref.extractall(extract_to)
-        return
 
-    if name.endswith(".tar.zst") or name.endswith(".tar..zst"):
-        with open(archive_path, "rb") as fh:
-            dctx = zstd.ZstdDecompressor()
-            with dctx.stream_reader(fh) as reader:
-                with tarfile.open(fileobj=reader) as tar_ref:
-                    tar_ref.extractall(extract_to)
-        return
+def _list_7z_members(
+    archive_path: Path,
+) -> list[str]:
+    """读取 7z 压缩包的成员列表
 
-    if name.endswith(".7z"):
-        with py7zr.SevenZipFile(archive_path, mode="r") as archive:
-            archive.extractall(path=extract_to)
-        return
+    Args:
+        archive_path (Path): 压缩包路径
+    Returns:
+        list[str]: 成员路径列表
+    """
+    import py7zr  # pylint: disable=import-outside-toplevel
 
-    if name.endswith(".rar"):
-        with rarfile.RarFile(archive_path, mode="r") as archive:
-            archive.extractall(path=extract_to)
-        return
+    with py7zr.SevenZipFile(archive_path, mode="r") as archive:
+        return archive.getnames()
+
+
+def _list_rar_members(
+    archive_path: Path,
+) -> list[str]:
+    """读取 rar 压缩包的成员列表
+
+    Args:
+        archive_path (Path): 压缩包路径
+    Returns:
+        list[str]: 成员路径列表
+    """
+    import rarfile  # pylint: disable=import-outside-toplevel
+
+    with rarfile.RarFile(archive_path, mode="r") as archive:
+        return archive.namelist()
+
+
+ARCHIVE_MEMBER_LISTERS: dict[str, Callable[[Path], list[str]]] = {
+    ".zip": _list_zip_members,
+    ".7z": _list_7z_members,
+    ".rar": _list_rar_members,
+}
+"""带有成员索引, 可以在不解压的情况下读取成员列表的压缩包格式"""
+
+
+def archive_may_contain(
+    archive_path: Path,
+    name_predicate: Callable[[str], bool],
+) -> bool:
+    """在不解压的情况下检查压缩包中是否可能含有文件名满足条件的文件
+
+    tar 系列格式没有成员索引, 读取成员列表需要完整解压一遍, 此时总是返回 True
+
+    Args:
+        archive_path (Path): 压缩包路径
+        name_predicate (Callable[[str], bool]): 判断文件名 (不含目录) 是否满足条件的函数
+    Returns:
+        bool: 压缩包可能含有满足条件的文件时返回 True, 确定不含有时返回 False
+    """
+    name = archive_path.name.lower()
+    for suffix, lister in ARCHIVE_MEMBER_LISTERS.items():
+        if name.endswith(suffix):
+            try:
+                members = lister(archive_path)
+            except Exception as e:
+                # 无法读取成员列表时交由解压流程处理
+                logger.debug("读取 '%s' 的成员列表失败: %s", archive_path, e)
+                return True
+            return any(name_predicate(m.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]) for m in members)
+
+    return True
 
 
 def create_archive(
@@ -177,6 +380,8 @@ def create_archive(
 
     # 7z
     if name.endswith(".7z"):
+        import py7zr  # pylint: disable=import-outside-toplevel
+
         with py7zr.SevenZipFile(archive_path, mode="w") as archive:
             for src in sources:
                 if src.is_dir():
@@ -217,6 +422,8 @@ def create_archive(
 
     # .tar.zst 使用 zstandard 的流写入
     if name.endswith(".tar.zst") or name.endswith(".tar..zst"):
+        import zstandard as zstd  # pylint: disable=import-outside-toplevel
+
         with open(archive_path, "wb") as fh:
             cctx = zstd.ZstdCompressor()
             with cctx.stream_writer(fh) as compressor:
@@ -3,7 +3,13 @@
 import os
 import stat
 import shutil
+from collections import deque
 from pathlib import Path
+from typing import (
+    Callable,
+    Generator,
+    Iterable,
+)
 
 from tqdm import tqdm
 
@@ -33,9 +39,12 @@ def remove_files(
         OSError: 删除过程中的系统错误
     """
 
-    if not path.exists():
+    # 使用 lstat 获取一次文件信息, 同时可以正确处理失效的软链接
+    try:
+        path_stat = path.lstat()
+    except FileNotFoundError as e:
         logger.error("路径不存在: '%s'", path)
-        raise ValueError(f"要删除的 {path} 路径不存在")
+        raise ValueError(f"要删除的 {path} 路径不存在") from e
 
     def _handle_remove_readonly(
         func,
@@ -48,29 +57,60 @@ def remove_files(
             func(path_str)
 
     try:
-        if path.is_file() or path.is_symlink():
-            # 处理文件或符号链接
-            os.chmod(path, stat.S_IWRITE)
-            path.unlink()
-
-        elif path.is_dir():
+        if stat.S_ISDIR(path_stat.st_mode):
             # 处理文件夹
             shutil.rmtree(path, onerror=_handle_remove_readonly)
+        else:
+            # 处理文件或符号链接, 符号链接不修改其指向的文件的权限
+            if not stat.S_ISLNK(path_stat.st_mode):
+                os.chmod(path, stat.S_IWRITE)
+            path.unlink()
 
     except OSError as e:
         logger.error("删除失败: '%s' - 原因: %s", path, e)
         raise e
 
 
+def _link_or_copy(
+    src: str,
+    dst: str,
+) -> None:
+    """创建硬链接代替复制文件, 无法创建硬链接时 (如文件系统不支持) 则复制文件
+
+    目标已存在时先删除目标的目录项再创建, 不会原地改写目标文件的内容, 避免影响与目标共享同一文件的其他硬链接
+
+    Args:
+        src (str): 源文件路径
+        dst (str): 目标文件路径
+    """
+    if os.path.lexists(dst):
+        try:
+            # 目标已经是指向同一文件的硬链接时无需处理
+            if os.path.samefile(src, dst):
+                return
+        except OSError:
+            # 目标为失效的软链接等情况, 直接替换
+            pass
+
+        os.unlink(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def copy_files(
     src: Path,
     dst: Path,
+    hardlink: bool | None = False,
 ) -> None:
     """复制文件或目录
 
     Args:
         src (Path): 源文件路径
         dst (Path): 复制文件到指定的路径
+        hardlink (bool | None): 源路径与目标路径处于同一文件系统时使用硬链接代替复制, 仅适用于复制后不会再修改源文件的场景 (如从临时目录导出)
     Raises:
         PermissionError: 没有权限复制文件时
         OSError: 复制文件失败时
@@ -82,18 +122,21 @@ def copy_files(
         src_path = src.resolve()
         dst_path = dst.resolve()
 
-        # 检查源是否存在
-        if not src_path.exists():
+        # 检查源是否存在, 只获取一次文件信息供后续判断使用
+        try:
+            src_stat = src_path.stat()
+        except FileNotFoundError as e:
             logger.error("源路径不存在: '%s'", src)
-            raise FileNotFoundError(f"源路径不存在: {src}")
+            raise FileNotFoundError(f"源路径不存在: {src}") from e
+        src_is_dir = stat.S_ISDIR(src_stat.st_mode)
 
         # 防止递归复制（例如将目录复制到其自身的子目录中）
-        if src_path.is_dir() and dst_path.is_relative_to(src_path):
+        if src_is_dir and dst_path.is_relative_to(src_path):
             logger.error("不能将目录复制到自身或其子目录中: '%s'", src)
             raise ValueError(f"不能将目录复制到自身或其子目录中: {src}")
 
         # 如果目标是已存在的目录, 则在其下创建同名项
-        if dst_path.exists() and dst_path.is_dir():
+        if dst_path.is_dir():
             dst_file = dst_path / src_path.name
         else:
             dst_file = dst_path
@@ -101,18 +144,24 @@ def copy_files(
         # 确保目标父目录存在
         dst_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # 同一文件系统中使用硬链接, 只需创建目录项而无需读写文件内容
+        if hardlink and src_stat.st_dev == dst_file.parent.stat().st_dev:
+            copy_function = _link_or_copy
+        else:
+            copy_function = shutil.copy2
+
         # 复制操作
-        if src_path.is_file():
+        if not src_is_dir:
             # copy2 会尽量保留文件元数据
-            shutil.copy2(src_path, dst_file)
+            copy_function(src_path, dst_file)
         else:
             # symlinks=True: 保留软链接本身而非复制指向的内容
             # dirs_exist_ok=True: 实现合并逻辑，如果目标目录已存在则覆盖同名文件
             try:
-                shutil.copytree(src_path, dst_file, symlinks=True, dirs_exist_ok=True)
+                shutil.copytree(src_path, dst_file, symlinks=True, dirs_exist_ok=True, copy_function=copy_function)
             except shutil.Error:
                 # Linux 中遇到已存在的软链接会导致失败, 则使用 symlinks=False 重试
-                shutil.copytree(src_path, dst_file, symlinks=False, dirs_exist_ok=True)
+                shutil.copytree(src_path, dst_file, symlinks=False, dirs_exist_ok=True, copy_function=copy_function)
 
     except PermissionError as e:
         logger.error("权限错误, 请检查文件权限或以管理员身份运行: %s", e)
@@ -125,12 +174,95 @@ def copy_files(
         raise e
 
 
+def iter_file_list(
+    path: Path,
+    resolve: bool | None = False,
+    max_depth: int | None = -1,
+    show_progress: bool | None = True,
+    include_dirs: bool | None = False,
+    suffixes: tuple[str, ...] | None = None,
+    name_predicate: Callable[[str], bool] | None = None,
+    follow_symlinks: bool | None = False,
+) -> Generator[Path, None, None]:
+    """逐个生成当前路径下的所有文件（和可选的目录）的绝对路径
+
+    Args:
+        path (Path): 要获取列表的目录
+        resolve (bool | None): 将路径进行完全解析, 包括链接路径
+        max_depth (int | None): 最大遍历深度, -1 表示不限制深度, 0 表示只遍历当前目录
+        show_progress (bool | None): 是否显示 tqdm 进度条
+        include_dirs (bool | None): 是否在结果中包含目录路径
+        suffixes (tuple[str, ...] | None): 仅保留文件名以这些后缀结尾的文件, 不影响目录
+        name_predicate (Callable[[str], bool] | None): 仅保留文件名满足该条件的文件, 不影响目录
+        follow_symlinks (bool | None): 是否进入指向目录的软链接中遍历, 启用时应限制 max_depth 以避免循环链接
+    Returns:
+        (Generator[Path, None, None]): 一个生成器, 每次迭代返回一个绝对路径
+    """
+
+    if not path or not path.exists():
+        return
+
+    def _match(name: str) -> bool:
+        """检查文件名是否满足过滤条件"""
+        if suffixes and not name.endswith(suffixes):
+            return False
+        return name_predicate is None or name_predicate(name)
+
+    if path.is_file():
+        if _match(path.name):
+            yield path.resolve() if resolve else path.absolute()
+        return
+
+    # 使用显式栈代替 os.walk, 深度由入栈时记录, 无需对每个目录调用 resolve()
+    stack: list[tuple[str, int]] = [(str(path.absolute()), 0)]
+    with tqdm(desc=f"扫描目录 {path}", leave=True, disable=not show_progress) as file_pbar:
+        while stack:
+            current_dir, depth = stack.pop()
+            # 是否允许继续向下遍历
+            can_descend = max_depth == -1 or depth < max_depth
+            dir_entries: list[str] = []
+            file_entries: list[str] = []
+            sub_dirs: list[str] = []
+            try:
+                # 先读取完整个目录再生成结果, 避免调用方处理时长时间占用目录句柄
+                with os.scandir(current_dir) as it:
+                    for entry in it:
+                        # DirEntry 的类型信息来自 readdir, 大多数情况下无需额外的 stat 调用
+                        # 与 os.walk 保持一致: 指向目录的软链接视为目录, 默认不进入其中遍历
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        if is_dir:
+                            dir_entries.append(entry.path)
+                            if can_descend and (follow_symlinks or not entry.is_symlink()):
+                                sub_dirs.append(entry.path)
+                        else:
+                            # 在构造 Path 对象之前按文件名进行过滤
+                            if _match(entry.name):
+                                file_entries.append(entry.path)
+            except OSError as e:
+                logger.debug("无法访问目录: '%s' - 原因: %s", current_dir, e)
+                continue
+
+            # 倒序入栈以保持与 os.walk 相同的自上而下遍历顺序
+            stack.extend((d, depth + 1) for d in reversed(sub_dirs))
+            entries = (dir_entries + file_entries) if include_dirs else file_entries
+            file_pbar.update(len(entries))
+            for p in entries:
+                yield Path(p).resolve() if resolve else Path(p)
+
+
 def get_file_list(
     path: Path,
     resolve: bool | None = False,
     max_depth: int | None = -1,
     show_progress: bool | None = True,
     include_dirs: bool | None = False,
+    suffixes: tuple[str, ...] | None = None,
+    name_predicate: Callable[[str], bool] | None = None,
+    follow_symlinks: bool | None = False,
 ) -> list[Path]:
     """获取当前路径下的所有文件（和可选的目录）的绝对路径
 
@@ -140,50 +272,74 @@ def get_file_list(
         max_depth (int | None): 最大遍历深度, -1 表示不限制深度, 0 表示只遍历当前目录
         show_progress (bool | None): 是否显示 tqdm 进度条
         include_dirs (bool | None): 是否在结果中包含目录路径
+        suffixes (tuple[str, ...] | None): 仅保留文件名以这些后缀结尾的文件, 不影响目录
+        name_predicate (Callable[[str], bool] | None): 仅保留文件名满足该条件的文件, 不影响目录
+        follow_symlinks (bool | None): 是否进入指向目录的软链接中遍历, 启用时应限制 max_depth 以避免循环链接
     Returns:
         (list[Path]): 路径列表的绝对路径
     """
+    return list(
+        iter_file_list(
+            path=path,
+            resolve=resolve,
+            max_depth=max_depth,
+            show_progress=show_progress,
+            include_dirs=include_dirs,
+            suffixes=suffixes,
+            name_predicate=name_predicate,
+            follow_symlinks=follow_symlinks,
+        )
+    )
+
+
+def find_first(
+    path: Path,
+    predicate: Callable[[Path], bool],
+    max_depth: int | None = -1,
+    name_predicate: Callable[[str], bool] | None = None,
+    follow_symlinks: bool | None = False,
+) -> Path | None:
+    """按广度优先的顺序搜索目录中第一个满足条件的文件, 找到后立即停止遍历
 
-    if not path or not path.exists():
-        return []
-
-    if path.is_file():
-        return [path.resolve() if resolve else path.absolute()]
-
-    base_depth = len(path.resolve().parts)
-
-    file_list: list[Path] = []
-    with tqdm(desc=f"扫描目录 {path}", position=0, leave=True, disable=not show_progress) as dir_pbar:
-        with tqdm(desc="发现条目数", position=1, leave=True, disable=not show_progress) as file_pbar:
-            for root, dirs, files in os.walk(path):
-                root_path = Path(root)
-                current_depth = len(root_path.resolve().parts) - base_depth
-
-                # 超过最大深度则阻止继续向下遍历
-                if max_depth != -1 and current_depth >= max_depth:
-                    # 如果需要包含目录, 虽然停止深挖, 但当前层的目录仍可加入
-                    if include_dirs:
-                        for d in dirs:
-                            dir_path = root_path / d
-                            file_list.append(dir_path.resolve() if resolve else dir_path.absolute())
-                            file_pbar.update(1)
-                    dirs.clear()
-                else:
-                    # 如果启用，将当前层级的目录加入列表
-                    if include_dirs:
-                        for d in dirs:
-                            dir_path = root_path / d
-                            file_list.append(dir_path.resolve() if resolve else dir_path.absolute())
-                            file_pbar.update(1)
-
-                for file in files:
-                    file_path = root_path / file
-                    file_list.append(file_path.resolve() if resolve else file_path.absolute())
-                    file_pbar.update(1)
-
-                dir_pbar.update(1)
-
-    return file_list
+    Args:
+        path (Path): 要搜索的目录
+        predicate (Callable[[Path], bool]): 判断文件是否为搜索目标的函数
+        max_depth (int | None): 最大遍历深度, -1 表示不限制深度, 0 表示只遍历当前目录
+        name_predicate (Callable[[str], bool] | None): 在调用 predicate 之前按文件名进行预过滤
+        follow_symlinks (bool | None): 是否进入指向目录的软链接中遍历, 启用时应限制 max_depth 以避免循环链接
+    Returns:
+        (Path | None): 找到的文件的绝对路径, 未找到时返回 None
+    """
+    if not path or not path.is_dir():
+        return None
+
+    queue: deque[tuple[str, int]] = deque([(str(path.absolute()), 0)])
+    while queue:
+        current_dir, depth = queue.popleft()
+        can_descend = max_depth == -1 or depth < max_depth
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        if can_descend and (follow_symlinks or not entry.is_symlink()):
+                            queue.append((entry.path, depth + 1))
+                        continue
+
+                    if name_predicate is not None and not name_predicate(entry.name):
+                        continue
+
+                    file_path = Path(entry.path)
+                    if predicate(file_path):
+                        return file_path
+        except OSError as e:
+            logger.debug("无法访问目录: '%s' - 原因: %s", current_dir, e)
+
+    return None
 
 
 def save_create_symlink(
@@ -193,7 +349,7 @@ def save_create_symlink(
     """创建软链接, 当创建软链接失败时则尝试复制文件
 
     Args:
-        target (Path): 源文件路径
+        target (Path): 源文件路径, 为相对路径时相对于软链接所在的目录
         link (Path): 软链接到的目的路径
     """
     try:
@@ -201,7 +357,37 @@ def save_create_symlink(
         logger.debug("创建软链接: '%s' -> '%s'", target, link)
     except OSError:
         logger.debug("尝试创建软链接失败, 尝试复制文件: '%s' -> '%s'", target, link)
-        copy_files(target, link)
+        # 相对路径的链接目标按软链接所在的目录解析, 与软链接的行为保持一致
+        copy_files(target if target.is_absolute() else link.parent / target, link)
+
+
+def save_create_symlinks(
+    directory: Path,
+    links: Iterable[tuple[Path, Path]],
+) -> None:
+    """在同一目录中批量创建软链接, 当创建软链接失败时则尝试复制文件
+
+    在支持 dir_fd 的平台上只打开一次目录, 之后每个软链接只需要一次相对于该目录的系统调用
+
+    Args:
+        directory (Path): 创建软链接所在的目录
+        links (Iterable[tuple[Path, Path]]): (链接目标, 软链接名称) 列表, 软链接名称为相对于 directory 的路径
+    """
+    if os.symlink not in os.supports_dir_fd:
+        for target, name in links:
+            save_create_symlink(target, directory / name)
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for target, name in links:
+            try:
+                os.symlink(target, name, dir_fd=dir_fd)
+                logger.debug("创建软链接: '%s' -> '%s'", target, directory / name)
+            except OSError:
+                save_create_symlink(target, directory / name)
+    finally:
+        os.close(dir_fd)
 
 
 def safe_is_file(
@@ -233,6 +419,30 @@ def safe_is_file(
     return False
 
 
+def is_file_up_to_date(
+    src: Path,
+    dst: Path,
+) -> bool:
+    """通过文件元数据检查目标文件是否已是源文件的副本, 无需读取文件内容
+
+    `copy_files()` 复制文件时会保留修改时间, 因此只有当目标文件大小和修改时间都与源文件完全一致时, 才视为无需再次复制;
+    修改时间更新的目标文件可能由其他工具写入, 不能视为源文件的副本
+
+    Args:
+        src (Path): 源文件路径
+        dst (Path): 目标文件路径
+    Returns:
+        bool: 目标文件已是最新的副本时返回 True
+    """
+    try:
+        src_stat = src.stat()
+        dst_stat = dst.stat()
+    except OSError:
+        return False
+
+    return stat.S_ISREG(dst_stat.st_mode) and src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+
 def get_real_path(
     path: Path,
 ) -> Path:
@@ -53,6 +53,10 @@ class LoggingColoredFormatter(logging.Formatter):
         return super().format(colored_record)
 
 
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+"""已初始化的 Logging 对象缓存, 键为 Logging 名称"""
+
+
 def get_logger(
     name: str | None = None,
     level: int | None = logging.INFO,
@@ -68,6 +72,13 @@ def get_logger(
         logging.Logger: Logging 对象
     """
     if name is not None:
+        # 各模块在导入时均会以相同的名称获取 Logging 对象, 已初始化时直接返回, 跳过处理器配置和调用栈查找
+        cached_logger = _LOGGER_CACHE.get(name)
+        if cached_logger is not None:
+            if cached_logger.level != level:
+                cached_logger.setLevel(level)
+            return cached_logger
+
         log_format = "[%(name)s]-|%(asctime)s|-%(levelname)s: %(message)s"
         logger_name = name
     else:
@@ -93,4 +104,6 @@ def get_logger(
     logger.setLevel(level)
     fn, lno, func, _ = logger.findCaller(stack_info=False, stacklevel=2)
     logger.debug("Logger 初始化完成, 位置: %s:%s in %s", fn, lno, func)
+    if name is not None:
+        _LOGGER_CACHE[name] = logger
     return logger
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from typing import (
+    NamedTuple,
     TypeAlias,
     TypedDict,
 )
@@ -63,16 +64,19 @@ class CursorKeys(TypedDict):
 CURSOR_KEYS: CursorKeys = {"win": WIN_CURSOR_KEYS, "linux": LINUX_CURSOR_KEYS}
 """鼠标指针对应的键值表 (Windows / Linux)"""
 
+CURSOR_KEY_PAIRS: tuple[tuple[str, str], ...] = tuple(zip(WIN_CURSOR_KEYS, LINUX_CURSOR_KEYS))
+"""Windows 与 Linux 鼠标指针键名的对应关系, 在模块加载时生成一次, 避免每次调用时重新 zip"""
 
-class CursorFilePair(TypedDict):
-    """单个光标文件的源路径与目标路径"""
 
-    dst_path: Path | None
-    """复制到系统的目标路径"""
+class CursorFilePair(NamedTuple):
+    """单个光标文件的源路径与目标路径"""
 
     src_path: Path | None
     """原始文件路径"""
 
+    dst_path: Path | None
+    """复制到系统的目标路径"""
+
 
 class KnownCursorMap(TypedDict, total=False):
     """Windows / Linux 标准鼠标指针类型, 键名以 Windows 中的作为标准"""
@@ -16,9 +16,10 @@ except ImportError:
     win32com = NotImplemented  # pylint: disable=invalid-name
 
 from ani2xcur.manager.regedit import (
+    registry_enum_values,
     registry_query_value,
     registry_set_value,
-    registry_enum_values,
+    registry_set_values,
     RegistryAccess,
     RegistryRootKey,
     RegistryValueType,
@@ -38,6 +39,9 @@ WINDOWS_CURSOR_CURSORS_SCHEME_PATH = r"Control Panel\Cursors\Schemes"
 WINDOWS_ACCESSIBILITY_PATH = r"Software\Microsoft\Accessibility"
 """Windows 无障碍配置路径"""
 
+VAR_STRING_PATTERN = re.compile(r"%([^%]+)%")
+"""匹配 %var% 格式变量的正则表达式"""
+
 
 def has_var_string(
     text: str,
@@ -49,19 +53,20 @@ def has_var_string(
     Returns:
         bool: 如果字符串中存在 %var% 格式的变量则返回 True, 否则返回 False
     """
-    pattern = r"%([^%]+)%"
-    return bool(re.search(pattern, text))
+    return VAR_STRING_PATTERN.search(text) is not None
 
 
 def expand_var_string(
     text: str,
     vars_dict: dict[str, str] = None,
+    keys_lowercased: bool | None = False,
 ) -> str:
     """将字符串中的 %var% 变量进行替换, 并优先查找变量表中的值
 
     Args:
         text (str): 需要处理的字符串
         vars_dict (dict[str, str] | None): 变量字典
+        keys_lowercased (bool | None): 变量字典的键是否已经过 `lowercase_dict_keys()` 处理, 批量处理字符串时可预先处理一次变量字典
     Returns:
         str: 处理后的字符串
     """
@@ -70,16 +75,24 @@ def expand_var_string(
         match: re.Match,
     ) -> str:
         env_var = match.group(1)
-        env_var_lower = match.group(1).lower().strip()
+        if env_var == "10":
+            # INF 中的 %10% 表示 Windows 目录, 等同于 %SYSTEMROOT%
+            return vars_dict.get("systemroot", os.environ.get("SYSTEMROOT", r"%SYSTEMROOT%"))
+
+        env_var_lower = env_var.lower().strip()
         return vars_dict.get(env_var_lower, os.environ.get(env_var, match.group(0)))
 
+    # 不含 % 的字符串不存在变量, 无需进行替换
+    if "%" not in text:
+        return text
+
     if vars_dict is None:
         vars_dict = {}
 
-    pattern = r"%([^%]+)%"
-    text = text.replace(r"%10%", r"%SYSTEMROOT%")
-    vars_dict = lowercase_dict_keys(vars_dict)
-    result = re.sub(pattern, _replace_env_var, text)
+    if not keys_lowercased:
+        vars_dict = lowercase_dict_keys(vars_dict)
+
+    result = VAR_STRING_PATTERN.sub(_replace_env_var, text)
     return result
 
 
@@ -124,7 +137,17 @@ def set_windows_cursor_theme(
     Args:
         cursor_name (str): 要设置的鼠标指针配置名称
     """
-    # 获取鼠标指针方案列表
+    # 直接查询指定的鼠标指针方案, 无需枚举全部方案
+    scheme_data = registry_query_value(
+        name=cursor_name,
+        sub_key=WINDOWS_CURSOR_CURSORS_SCHEME_PATH,
+        key=RegistryRootKey.CURRENT_USER,
+        access=RegistryAccess.READ,
+    )
+    if scheme_data is None:
+        return
+
+    # 注册表值名称不区分大小写, 需要确认方案名称大小写完全一致, 避免写入与已有方案不一致的名称
     schemes = registry_enum_values(
         sub_key=WINDOWS_CURSOR_CURSORS_SCHEME_PATH,
         key=RegistryRootKey.CURRENT_USER,
@@ -133,31 +156,22 @@ def set_windows_cursor_theme(
     if cursor_name not in schemes:
         return
 
-    scheme_data = schemes[cursor_name]
-    cursor_paths = [x for x in extend_list_to_length(scheme_data.split(","), target_length=len(CURSOR_KEYS["win"]))]
+    win_keys = CURSOR_KEYS["win"]
+    cursor_paths = extend_list_to_length(scheme_data.split(","), target_length=len(win_keys))
 
-    # 设置方案名称
-    registry_set_value(
-        name="",
-        value=cursor_name,
-        reg_type=RegistryValueType.SZ,
+    # 设置方案名称和鼠标指针对应的文件路径, 在同一个注册表键下一次写入
+    items: list[tuple[str, str, RegistryValueType]] = [("", cursor_name, RegistryValueType.SZ)]
+    for cursor, path in zip(win_keys, cursor_paths):
+        reg_type = RegistryValueType.EXPAND_SZ if has_var_string(path) else RegistryValueType.SZ
+        items.append((cursor, path, reg_type))
+
+    registry_set_values(
+        items=items,
         sub_key=WINDOWS_CURSOR_CURSORS_PATH,
         key=RegistryRootKey.CURRENT_USER,
         access=RegistryAccess.SET_VALUE,
     )
 
-    # 设置鼠标指针对应的文件路径
-    for cursor, path in zip(CURSOR_KEYS["win"], cursor_paths):
-        reg_type = RegistryValueType.EXPAND_SZ if has_var_string(path) else RegistryValueType.SZ
-        registry_set_value(
-            name=cursor,
-            value=path,
-            reg_type=reg_type,
-            sub_key=WINDOWS_CURSOR_CURSORS_PATH,
-            key=RegistryRootKey.CURRENT_USER,
-            access=RegistryAccess.SET_VALUE,
-        )
-
     refresh_system_params()
 
 
@@ -7,8 +7,16 @@ import ctypes.util
 import itertools
 import platform
 import shutil
-from typing import Generator
-from tempfile import TemporaryDirectory
+from functools import (
+    cache,
+    wraps,
+)
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    TypeVar,
+)
 from pathlib import Path
 from datetime import datetime
 
@@ -17,8 +25,7 @@ try:
 except ImportError:
     winreg = NotImplemented
 
-from ani2xcur.downloader import download_file_from_url
-from ani2xcur.file_operations.archive_manager import extract_archive
+from ani2xcur.downloader import download_and_extract_from_url
 from ani2xcur.cmd import run_cmd
 from ani2xcur.logger import get_logger
 from ani2xcur.config import (
@@ -42,13 +49,17 @@ from ani2xcur.manager.regedit import (
     RegistryAccess,
     RegistryRootKey,
     RegistryValueType,
-    registry_set_value,
+    registry_set_values,
     registry_create_path,
     registry_delete_tree,
     registry_query_value,
+    registry_query_values,
 )
 from ani2xcur.file_operations.file_manager import remove_files
-from ani2xcur.manager.desktop_config.windows import create_windows_shortcut
+from ani2xcur.manager.desktop_config.windows import (
+    broadcast_settings_change,
+    create_windows_shortcut,
+)
 
 logger = get_logger(
     name=LOGGER_NAME,
@@ -63,10 +74,83 @@ IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH = r"SOFTWARE\ImageMagick\Current"
 IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\ImageMagick 7.1.2 Q16-HDRI (64-bit)_is1"
 """ImageMagick 注册表卸载面板信息"""
 
-IMAGE_MAGICK_WINDOWS_ICON_PATH = Path(os.getenv("ProgramData", "C:/ProgramData")) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "ImageMagick 7.1.2 Q16-HDRI (64-bit)"
+IMAGE_MAGICK_WINDOWS_ICON_GROUP = "ImageMagick 7.1.2 Q16-HDRI (64-bit)"
+"""ImageMagick 开始菜单快捷方式组名称"""
+
+WINDOWS_START_MENU_PROGRAMS_PATH = Path(os.getenv("ProgramData", r"C:\ProgramData")) / "Microsoft" / "Windows" / "Start Menu" / "Programs"
+"""Windows 所有用户的开始菜单程序目录"""
+
+IMAGE_MAGICK_WINDOWS_ICON_PATH = WINDOWS_START_MENU_PROGRAMS_PATH / IMAGE_MAGICK_WINDOWS_ICON_GROUP
 """ImageMagick 快捷方式路径"""
 
+IMAGE_MAGICK_WINDOWS_REGISTRY_STATIC_CONFIG: tuple[tuple[str, str | int, RegistryValueType], ...] = (
+    ("Version", "7.1.2", RegistryValueType.SZ),
+    ("QuantumDepth", 10, RegistryValueType.DWORD),
+)
+"""ImageMagick 注册表配置信息中与安装路径无关的值"""
+
+IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_STATIC_CONFIG: tuple[tuple[str, str | int, RegistryValueType], ...] = (
+    (
+        "DisplayName",
+        "ImageMagick 7.1.2-12 Q16-HDRI (64-bit) (2025-12-28)",
+        RegistryValueType.SZ,
+    ),
+    ("DisplayVersion", "7.1.2.12", RegistryValueType.SZ),
+    ("EstimatedSize", 0xEB6F, RegistryValueType.DWORD),
+    ("HelpLink", "http://www.imagemagick.org/", RegistryValueType.SZ),
+    (
+        "Inno Setup: Deselected Tasks",
+        "legacy_support,install_devel,install_perlmagick",
+        RegistryValueType.SZ,
+    ),
+    ("Inno Setup: Icon Group", IMAGE_MAGICK_WINDOWS_ICON_GROUP, RegistryValueType.SZ),
+    ("Inno Setup: Language", "default", RegistryValueType.SZ),
+    ("Inno Setup: Selected Tasks", "modifypath", RegistryValueType.SZ),
+    ("Inno Setup: Setup Version", "6.2.0", RegistryValueType.SZ),
+    ("MajorVersion", 7, RegistryValueType.DWORD),
+    ("MinorVersion", 1, RegistryValueType.DWORD),
+    ("NoModify", 1, RegistryValueType.DWORD),
+    ("NoRepair", 1, RegistryValueType.DWORD),
+    ("Publisher", "ImageMagick Studio LLC", RegistryValueType.SZ),
+    ("URLInfoAbout", "http://www.imagemagick.org/", RegistryValueType.SZ),
+    (
+        "URLUpdateInfo",
+        "http://www.imagemagick.org/script/download.php",
+        RegistryValueType.SZ,
+    ),
+    ("VersionMajor", 7, RegistryValueType.DWORD),
+    ("VersionMinor", 1, RegistryValueType.DWORD),
+)
+"""ImageMagick 注册表卸载面板信息中与安装路径, 安装用户和安装日期无关的值"""
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _invalidate_image_magick_cache(
+    func: _F,
+) -> _F:
+    """在安装 / 卸载 ImageMagick 前后清除 ImageMagick 安装状态和安装路径的缓存
+
+    Args:
+        func (_F): 安装或卸载 ImageMagick 的函数
+    Returns:
+        _F: 会清除缓存的函数
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        check_image_magick_is_installed.cache_clear()
+        find_image_magick_install_path_windows.cache_clear()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            check_image_magick_is_installed.cache_clear()
+            find_image_magick_install_path_windows.cache_clear()
+
+    return wrapper  # type: ignore[return-value]
 
+
+@_invalidate_image_magick_cache
 def install_image_magick_windows(
     install_path: Path | None = None,
 ) -> None:
@@ -87,97 +171,14 @@ def install_image_magick_windows(
     if install_path is None:
         install_path = IMAGE_MAGICK_WINDOWS_INSTALL_PATH
 
-    # 注册表配置
-    registry_config: list[tuple[str, str | int, RegistryValueType]] = [
-        ("Version", "7.1.2", RegistryValueType.SZ),
-        ("QuantumDepth", 10, RegistryValueType.DWORD),
-        ("LibPath", str(install_path), RegistryValueType.SZ),
-        (
-            "FilterModulesPath",
-            str(install_path / "modules" / "filters"),
-            RegistryValueType.SZ,
-        ),
-        ("ConfigurePath", str(install_path), RegistryValueType.SZ),
-        (
-            "CoderModulesPath",
-            str(install_path / "modules" / "coders"),
-            RegistryValueType.SZ,
-        ),
-        ("BinPath", str(install_path), RegistryValueType.SZ),
-    ]
-    registry_sub_config: list[tuple[str, str | int, RegistryValueType]] = [
-        ("LibPath", str(install_path), RegistryValueType.SZ),
-        (
-            "FilterModulesPath",
-            str(install_path / "modules" / "filters"),
-            RegistryValueType.SZ,
-        ),
-        ("ConfigurePath", str(install_path), RegistryValueType.SZ),
-        (
-            "CoderModulesPath",
-            str(install_path / "modules" / "coders"),
-            RegistryValueType.SZ,
-        ),
-        ("BinPath", str(install_path), RegistryValueType.SZ),
-    ]
-    uninstall_exe = str(install_path / "unins000.exe")
-    uninstall_config: list[tuple[str, str | int, RegistryValueType]] = [
-        ("DisplayIcon", str(install_path / "ImageMagick.ico"), RegistryValueType.SZ),
-        (
-            "DisplayName",
-            "ImageMagick 7.1.2-12 Q16-HDRI (64-bit) (2025-12-28)",
-            RegistryValueType.SZ,
-        ),
-        ("DisplayVersion", "7.1.2.12", RegistryValueType.SZ),
-        ("EstimatedSize", int("eb6f", 16), RegistryValueType.DWORD),
-        ("HelpLink", "http://www.imagemagick.org/", RegistryValueType.SZ),
-        ("Inno Setup: App Path", str(install_path), RegistryValueType.SZ),
-        (
-            "Inno Setup: Deselected Tasks",
-            "legacy_support,install_devel,install_perlmagick",
-            RegistryValueType.SZ,
-        ),
-        (
-            "Inno Setup: Icon Group",
-            "ImageMagick 7.1.2 Q16-HDRI (64-bit)",
-            RegistryValueType.SZ,
-        ),
-        ("Inno Setup: Language", "default", RegistryValueType.SZ),
-        ("Inno Setup: Selected Tasks", "modifypath", RegistryValueType.SZ),
-        ("Inno Setup: Setup Version", "6.2.0", RegistryValueType.SZ),
-        ("Inno Setup: User", getpass.getuser(), RegistryValueType.SZ),
-        ("InstallDate", datetime.now().strftime(r"%Y%m%d"), RegistryValueType.SZ),
-        ("InstallLocation", str(install_path), RegistryValueType.SZ),
-        ("MajorVersion", 7, RegistryValueType.DWORD),
-        ("MinorVersion", 1, RegistryValueType.DWORD),
-        ("NoModify", 1, RegistryValueType.DWORD),
-        ("NoRepair", 1, RegistryValueType.DWORD),
-        ("Publisher", "ImageMagick Studio LLC", RegistryValueType.SZ),
-        ("QuietUninstallString", f'"{uninstall_exe}" /SILENT', RegistryValueType.SZ),
-        ("UninstallString", uninstall_exe, RegistryValueType.SZ),
-        ("URLInfoAbout", "http://www.imagemagick.org/", RegistryValueType.SZ),
-        (
-            "URLUpdateInfo",
-            "http://www.imagemagick.org/script/download.php",
-            RegistryValueType.SZ,
-        ),
-        ("VersionMajor", 7, RegistryValueType.DWORD),
-        ("VersionMinor", 1, RegistryValueType.DWORD),
-    ]
-
     logger.info("将 ImageMagick 安装到 Windows 系统中, 安装路径: '%s'", install_path)
     # 下载并解压 ImageMagick
-    with TemporaryDirectory() as tmp_dir:
-        tmp_dir = Path(tmp_dir)
-        logger.debug("从 '%s' 下载 ImageMagick", IMAGE_MAGICK_WINDOWS_DOWNLOAD_URL)
-        image_magick_archive_path = download_file_from_url(
-            url=IMAGE_MAGICK_WINDOWS_DOWNLOAD_URL,
-            save_path=tmp_dir,
-        )
-        extract_archive(
-            archive_path=image_magick_archive_path,
-            extract_to=install_path,
-        )
+    logger.debug("从 '%s' 下载 ImageMagick", IMAGE_MAGICK_WINDOWS_DOWNLOAD_URL)
+    download_and_extract_from_url(
+        url=IMAGE_MAGICK_WINDOWS_DOWNLOAD_URL,
+        extract_to=install_path,
+        chunk_size=1024 * 1024,  # ImageMagick 压缩包较大, 使用更大的数据块减少读取次数
+    )
 
     # 创建快捷方式
     shortcut_path = IMAGE_MAGICK_WINDOWS_ICON_PATH / "ImageMagick Web Pages.lnk"
@@ -200,6 +201,30 @@ def install_image_magick_windows(
     # ImageMagick 注册表配置信息 (子表路径)
     image_magick_windows_registry_sub_config_path = rf"SOFTWARE\ImageMagick\{version_number}\{quality_setting}"
 
+    # 注册表配置, 在 ImageMagick 下载解压成功后再构建
+    install_path_str = str(install_path)
+    modules_path = install_path / "modules"
+    filter_modules_path_str = str(modules_path / "filters")
+    coder_modules_path_str = str(modules_path / "coders")
+    uninstall_exe = str(install_path / "unins000.exe")
+    registry_sub_config: tuple[tuple[str, str | int, RegistryValueType], ...] = (
+        ("LibPath", install_path_str, RegistryValueType.SZ),
+        ("FilterModulesPath", filter_modules_path_str, RegistryValueType.SZ),
+        ("ConfigurePath", install_path_str, RegistryValueType.SZ),
+        ("CoderModulesPath", coder_modules_path_str, RegistryValueType.SZ),
+        ("BinPath", install_path_str, RegistryValueType.SZ),
+    )
+    registry_config = IMAGE_MAGICK_WINDOWS_REGISTRY_STATIC_CONFIG + registry_sub_config
+    uninstall_config = IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_STATIC_CONFIG + (
+        ("DisplayIcon", str(install_path / "ImageMagick.ico"), RegistryValueType.SZ),
+        ("Inno Setup: App Path", install_path_str, RegistryValueType.SZ),
+        ("Inno Setup: User", getpass.getuser(), RegistryValueType.SZ),
+        ("InstallDate", datetime.now().strftime(r"%Y%m%d"), RegistryValueType.SZ),
+        ("InstallLocation", install_path_str, RegistryValueType.SZ),
+        ("QuietUninstallString", f'"{uninstall_exe}" /SILENT', RegistryValueType.SZ),
+        ("UninstallString", uninstall_exe, RegistryValueType.SZ),
+    )
+
     logger.debug("写入 ImageMagick 信息到注册表中")
     # ImageMagick 配置信息
     registry_create_path(
@@ -207,30 +232,24 @@ def install_image_magick_windows(
         key=RegistryRootKey.LOCAL_MACHINE,
         access=RegistryAccess.WRITE,
     )
-    for key, value, dtype in registry_config:
-        registry_set_value(
-            name=key,
-            value=value,
-            reg_type=dtype,
-            sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH,
-            key=RegistryRootKey.LOCAL_MACHINE,
-            access=RegistryAccess.SET_VALUE,
-        )
+    registry_set_values(
+        items=registry_config,
+        sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH,
+        key=RegistryRootKey.LOCAL_MACHINE,
+        access=RegistryAccess.SET_VALUE,
+    )
 
     registry_create_path(
         sub_key=image_magick_windows_registry_sub_config_path,
         key=RegistryRootKey.LOCAL_MACHINE,
         access=RegistryAccess.WRITE,
     )
-    for key, value, dtype in registry_sub_config:
-        registry_set_value(
-            name=key,
-            value=value,
-            reg_type=dtype,
-            sub_key=image_magick_windows_registry_sub_config_path,
-            key=RegistryRootKey.LOCAL_MACHINE,
-            access=RegistryAccess.SET_VALUE,
-        )
+    registry_set_values(
+        items=registry_sub_config,
+        sub_key=image_magick_windows_registry_sub_config_path,
+        key=RegistryRootKey.LOCAL_MACHINE,
+        access=RegistryAccess.SET_VALUE,
+    )
 
     # ImageMagick 卸载配置信息
     registry_create_path(
@@ -238,15 +257,12 @@ def install_image_magick_windows(
         key=RegistryRootKey.LOCAL_MACHINE,
         access=RegistryAccess.WRITE,
     )
-    for key, value, dtype in uninstall_config:
-        registry_set_value(
-            name=key,
-            value=value,
-            reg_type=dtype,
-            sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH,
-            key=RegistryRootKey.LOCAL_MACHINE,
-            access=RegistryAccess.SET_VALUE,
-        )
+    registry_set_values(
+        items=uninstall_config,
+        sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH,
+        key=RegistryRootKey.LOCAL_MACHINE,
+        access=RegistryAccess.SET_VALUE,
+    )
 
     # 配置环境变量
     logger.debug("为 ImageMagick 配置环境变量")
@@ -293,20 +309,13 @@ def add_image_magick_to_path(
     Args:
         install_path (Path): ImageMagick 安装路径
     """
-    add_path_to_env_path(
-        new_path=str(install_path),
-        dtype="system",
-    )
-    add_path_to_env_path(
-        new_path=str(install_path),
-        dtype="user",
-    )
-    add_val_to_env(name="MAGICK_HOME", value=str(install_path), dtype="system")
-    add_val_to_env(
-        name="MAGICK_HOME",
-        value=str(install_path),
-        dtype="user",
-    )
+    install_path_str = str(install_path)
+    # 每次广播都需要等待所有顶层窗口响应, 修改完成后只广播一次
+    add_path_to_env_path(new_path=install_path_str, dtype="system", broadcast=False)
+    add_path_to_env_path(new_path=install_path_str, dtype="user", broadcast=False)
+    add_val_to_env(name="MAGICK_HOME", value=install_path_str, dtype="system", broadcast=False)
+    add_val_to_env(name="MAGICK_HOME", value=install_path_str, dtype="user", broadcast=False)
+    broadcast_settings_change()
 
 
 def delete_image_magick_to_path(
@@ -317,12 +326,16 @@ def delete_image_magick_to_path(
     Args:
         install_path (Path): ImageMagick 安装路径
     """
-    delete_path_from_env_path(key_path=str(install_path), dtype="system")
-    delete_path_from_env_path(key_path=str(install_path), dtype="user")
-    delete_val_from_env(name="MAGICK_HOME", dtype="system")
-    delete_val_from_env(name="MAGICK_HOME", dtype="user")
+    install_path_str = str(install_path)
+    # 每次广播都需要等待所有顶层窗口响应, 修改完成后只广播一次
+    delete_path_from_env_path(key_path=install_path_str, dtype="system", broadcast=False)
+    delete_path_from_env_path(key_path=install_path_str, dtype="user", broadcast=False)
+    delete_val_from_env(name="MAGICK_HOME", dtype="system", broadcast=False)
+    delete_val_from_env(name="MAGICK_HOME", dtype="user", broadcast=False)
+    broadcast_settings_change()
 
 
+@_invalidate_image_magick_cache
 def uninstall_image_magick_windows() -> None:
     """将 ImageMagick 从 Windows 系统上卸载
 
@@ -332,15 +345,15 @@ def uninstall_image_magick_windows() -> None:
         RuntimeError: 删除 ImageMagick 文件发生失败时
     """
 
-    if not check_image_magick_is_installed():
+    # 查找 ImageMagick 安装路径, 注册表中有安装路径即可确认已安装, 无需搜索 ImageMagick 链接库
+    install_path = find_image_magick_install_path_windows()
+
+    if install_path is None and not check_image_magick_is_installed():
         logger.info("ImageMagick 未安装在 Windows 系统中")
         return
 
     if not is_admin_on_windows():
-        raise PermissionError("当前未使用管理员权限运行 Ani2xcur, 卸载安装 ImageMagick, 请使用管理员权限进行重试")
-
-    # 查找 ImageMagick 安装路径
-    install_path = find_image_magick_install_path_windows()
+        raise PermissionError("当前未使用管理员权限运行 Ani2xcur, 无法卸载 ImageMagick, 请使用管理员权限进行重试")
 
     if install_path is None:
         raise FileNotFoundError("未找到 ImageMagick 安装路径, 无法卸载 ImageMagick")
@@ -383,50 +396,120 @@ def uninstall_image_magick_windows() -> None:
     logger.info("从 Windows 系统卸载 ImageMagick 完成")
 
 
+@cache
 def find_image_magick_install_path_windows() -> Path | None:
-    """在 Windows 系统中查找 ImageMagick 安装路径
+    """在 Windows 系统中查找 ImageMagick 安装路径, 结果会被缓存直到安装或卸载 ImageMagick
 
     Returns:
         (Path | None): ImageMagick 安装路径, 当未找到 ImageMagick 安装路径时则返回 None
     """
-    install_path = None
-    for name in ["BinPath", "ConfigurePath", "LibPath"]:
-        try:
-            logger.debug("在 '%s' 查找 ImageMagick 的键: '%s'", IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH, name)
-            install_path = registry_query_value(
-                name=name,
-                sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH,
-                key=RegistryRootKey.LOCAL_MACHINE,
-            )
-            install_path = Path(install_path)
-            if not install_path.is_dir():
-                install_path = None
-                continue
-        except FileNotFoundError:
-            continue
+    names = ("BinPath", "ConfigurePath", "LibPath")
+    try:
+        logger.debug("在 '%s' 查找 ImageMagick 的键: %s", IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH, names)
+        values = registry_query_values(
+            names=names,
+            sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_CONFIG_PATH,
+            key=RegistryRootKey.LOCAL_MACHINE,
+        )
+    except FileNotFoundError:
+        values = {}
 
-    if install_path is None:
-        try:
-            logger.debug("在 '%s' 查找 ImageMagick 的键: InstallLocation", IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH)
-            install_path = registry_query_value(
-                name="InstallLocation",
-                sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH,
-                key=RegistryRootKey.LOCAL_MACHINE,
-                access=RegistryAccess.READ,
-            )
-            install_path = Path(install_path)
-            if not install_path.is_dir():
-                install_path = None
-        except FileNotFoundError:
-            pass
+    for name in names:
+        install_path = values.get(name)
+        # 找到第一个有效的路径后即可停止查找
+        if install_path is not None and Path(install_path).is_dir():
+            return Path(install_path)
+
+    try:
+        logger.debug("在 '%s' 查找 ImageMagick 的键: InstallLocation", IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH)
+        install_path = registry_query_value(
+            name="InstallLocation",
+            sub_key=IMAGE_MAGICK_WINDOWS_REGISTRY_UNINSTALL_CONFIG_PATH,
+            key=RegistryRootKey.LOCAL_MACHINE,
+            access=RegistryAccess.READ,
+        )
+    except FileNotFoundError:
+        return None
+
+    if install_path is not None and Path(install_path).is_dir():
+        return Path(install_path)
 
-    return install_path
+    return None
 
 
+LINUX_PACKAGE_MANAGER_IMAGE_MAGICK_COMMANDS: tuple[tuple[str, str, list[list[str]], list[list[str]]], ...] = (
+    # Debian / Ubuntu
+    (
+        "apt",
+        "apt",
+        [["apt", "update"], ["apt", "install", "libmagickwand-dev", "-y"]],
+        # 使用 purge 可以同时删除配置文件，如果只需删除程序可用 remove
+        [["apt", "purge", "libmagickwand-dev", "-y"], ["apt", "autoremove", "-y"]],
+    ),
+    # CentOS / RHEL / Fedora
+    (
+        "yum",
+        "yum",
+        [["yum", "update"], ["yum", "install", "ImageMagick-devel", "-y"]],
+        [["yum", "remove", "ImageMagick-devel", "-y"]],
+    ),
+    # Alpine Linux
+    (
+        "apk",
+        "apk",
+        [["apk", "update"], ["apk", "add", "imagemagick"]],
+        [["apk", "del", "imagemagick"]],
+    ),
+    # Arch Linux
+    (
+        "pacman",
+        "pacman",
+        [["pacman", "-Syyu", "imagemagick", "--noconfirm"]],
+        # -Rs 会同时删除该软件及其不再被需要的依赖
+        [["pacman", "-Rs", "imagemagick", "--noconfirm"]],
+    ),
+    # openSUSE
+    (
+        "zypper",
+        "zypper",
+        [["zypper", "refresh"], ["zypper", "install", "ImageMagick", "-y"]],
+        [["zypper", "remove", "ImageMagick", "-y"]],
+    ),
+    # NixOS / Nix
+    (
+        "nix-env",
+        "nix",
+        [["nix-channel", "--update"], ["nix-env", "-iA", "nixos.imagemagick"]],
+        # 注意: nix-env 卸载时使用的是安装时的包名 (非属性路径 A)
+        [["nix-env", "-e", "imagemagick"]],
+    ),
+)
+"""Linux 包管理器安装 / 卸载 ImageMagick 的命令表, 按优先级排列, 每项为 (包管理器可执行文件, 包管理器名称, 安装命令, 卸载命令)"""
+
+
+def _find_linux_image_magick_commands(
+    uninstall: bool = False,
+) -> list[list[str]] | None:
+    """查找当前 Linux 系统可用的包管理器, 并返回安装或卸载 ImageMagick 的命令
+
+    Args:
+        uninstall (bool): 是否返回卸载命令
+    Returns:
+        (list[list[str]] | None): 安装或卸载 ImageMagick 的命令列表, 未找到支持的包管理器时返回 None
+    """
+    for executable, manager_name, install_cmd, uninstall_cmd in LINUX_PACKAGE_MANAGER_IMAGE_MAGICK_COMMANDS:
+        if shutil.which(executable):
+            logger.debug("匹配到 %s 包管理器", manager_name)
+            return uninstall_cmd if uninstall else install_cmd
+    return None
+
+
+@_invalidate_image_magick_cache
 def install_image_magick_linux() -> None:
     """在 Linux 系统中安装 ImageMagick
 
     Raises:
+        PermissionError: 当未使用 root 权限运行时
         RuntimeError: 当 Linux 不支持自动安装 ImageMagick 时
     """
     if check_image_magick_is_installed():
@@ -434,41 +517,11 @@ def install_image_magick_linux() -> None:
         return
 
     if not is_root_on_linux():
-        raise PermissionError("当前未使用管理员权限运行 Ani2xcur, 卸载安装 ImageMagick, 请使用管理员权限进行重试")
+        raise PermissionError("当前未使用 root 权限运行 Ani2xcur, 无法安装 ImageMagick, 请使用 root 权限进行重试")
 
     logger.info("安装 ImageMagick 到 Linux 系统中")
-    cmd: list[list[str]] = []
-
-    if shutil.which("apt"):
-        # Debian / Ubuntu
-        logger.debug("匹配到 apt 包管理器")
-        cmd.append(["apt", "update"])
-        cmd.append(["apt", "install", "libmagickwand-dev", "-y"])
-    elif shutil.which("yum"):
-        # CentOS / RHEL / Fedora
-        logger.debug("匹配到 yum 包管理器")
-        cmd.append(["yum", "update"])
-        cmd.append(["yum", "install", "ImageMagick-devel", "-y"])
-    elif shutil.which("apk"):
-        # Alpine Linux
-        logger.debug("匹配到 apk 包管理器")
-        cmd.append(["apk", "update"])
-        cmd.append(["apk", "add", "imagemagick"])
-    elif shutil.which("pacman"):
-        # Arch Linux
-        logger.debug("匹配到 pacman 包管理器")
-        cmd.append(["pacman", "-Syyu", "imagemagick", "--noconfirm"])
-    elif shutil.which("zypper"):
-        # openSUSE
-        logger.debug("匹配到 zypper 包管理器")
-        cmd.append(["zypper", "refresh"])
-        cmd.append(["zypper", "install", "ImageMagick", "-y"])
-    elif shutil.which("nix-env"):
-        # NixOS / Nix
-        logger.debug("匹配到 nix 包管理器")
-        cmd.append(["nix-channel", "--update"])
-        cmd.append(["nix-env", "-iA", "nixos.imagemagick"])
-    else:
+    cmd = _find_linux_image_magick_commands()
+    if cmd is None:
         raise RuntimeError("不支持的 Linux 系统, 无法自动安装 ImageMagick, 请尝试手动安装 ImageMagick")
 
     for c in cmd:
@@ -477,10 +530,12 @@ def install_image_magick_linux() -> None:
     logger.info("安装 ImageMagick 到 Linux 系统中成功")
 
 
+@_invalidate_image_magick_cache
 def uninstall_image_magick_linux() -> None:
     """在 Linux 系统中卸载 ImageMagick
 
     Raises:
+        PermissionError: 当未使用 root 权限运行时
         RuntimeError: 当 Linux 不支持自动卸载 ImageMagick 时
     """
     if not check_image_magick_is_installed():
@@ -488,40 +543,11 @@ def uninstall_image_magick_linux() -> None:
         return
 
     if not is_root_on_linux():
-        raise PermissionError("当前未使用管理员权限运行 Ani2xcur, 卸载安装 ImageMagick, 请使用管理员权限进行重试")
+        raise PermissionError("当前未使用 root 权限运行 Ani2xcur, 无法卸载 ImageMagick, 请使用 root 权限进行重试")
 
     logger.info("从 Linux 系统中卸载 ImageMagick 中")
-    cmd: list[list[str]] = []
-
-    if shutil.which("apt"):
-        # Debian / Ubuntu
-        logger.debug("匹配到 apt 包管理器")
-        # 使用 purge 可以同时删除配置文件，如果只需删除程序可用 remove
-        cmd.append(["apt", "purge", "libmagickwand-dev", "-y"])
-        cmd.append(["apt", "autoremove", "-y"])
-    elif shutil.which("yum"):
-        # CentOS / RHEL / Fedora
-        logger.debug("匹配到 yum 包管理器")
-        cmd.append(["yum", "remove", "ImageMagick-devel", "-y"])
-    elif shutil.which("apk"):
-        # Alpine Linux
-        logger.debug("匹配到 apk 包管理器")
-        cmd.append(["apk", "del", "imagemagick"])
-    elif shutil.which("pacman"):
-        # Arch Linux
-        logger.debug("匹配到 pacman 包管理器")
-        # -Rs 会同时删除该软件及其不再被需要的依赖
-        cmd.append(["pacman", "-Rs", "imagemagick", "--noconfirm"])
-    elif shutil.which("zypper"):
-        # openSUSE
-        logger.debug("匹配到 zypper 包管理器")
-        cmd.append(["zypper", "remove", "ImageMagick", "-y"])
-    elif shutil.which("nix-env"):
-        # NixOS / Nix
-        logger.debug("匹配到 nix 包管理器")
-        # 注意: nix-env 卸载时使用的是安装时的包名 (非属性路径 A)
-        cmd.append(["nix-env", "-e", "imagemagick"])
-    else:
+    cmd = _find_linux_image_magick_commands(uninstall=True)
+    if cmd is None:
         raise RuntimeError("不支持的 Linux 系统, 无法自动卸载 ImageMagick, 请尝试手动卸载")
 
     for c in cmd:
@@ -573,8 +599,9 @@ def find_wand_library_paths() -> Generator[tuple[str | None, str | None], None,
                 # 设置 magick_home 为库路径
                 magick_home = libPath[0]
 
-                # 将库路径、编解码器路径和滤镜路径添加到系统 PATH 环境变量中
-                os.environ["PATH"] += str((";" + libPath[0] + ";" + coderPath[0] + ";" + filterPath[0]))
+                # 将库路径、编解码器路径和滤镜路径添加到系统 PATH 环境变量中, 已存在的路径不重复添加
+                env_paths = os.environ["PATH"].split(";")
+                os.environ["PATH"] += "".join(f";{x}" for x in (libPath[0], coderPath[0], filterPath[0]) if x not in env_paths)
         except OSError:
             # 如果无法从注册表读取, 则使用 MAGICK_HOME 环境变量,
             # 并假设编解码器和滤镜 DLL 在相同的目录中
@@ -684,8 +711,9 @@ def find_wand_library_paths() -> Generator[tuple[str | None, str | None], None,
             yield libwand, libwand
 
 
+@cache
 def check_image_magick_is_installed() -> bool:
-    """检测 ImageMagick 是否已经安装
+    """检测 ImageMagick 是否已经安装, 结果会被缓存直到安装或卸载 ImageMagick
 
     Returns:
         bool: 当已经安装时则返回 True
@@ -696,8 +724,27 @@ def check_image_magick_is_installed() -> bool:
     # 或者注册表中`计算机\HKEY_LOCAL_MACHINE\SOFTWARE\ImageMagick\Current`的 LibPath, CoderModulesPath, FilterModulesPath
     # Linux 中是通过 ctypes.util.find_library() 查找
     for libwand_path, libmagick_path in find_wand_library_paths():
-        if libwand_path is not None or libmagick_path is not None:
+        if _is_library_found(libwand_path) or _is_library_found(libmagick_path):
             logger.debug("找到 ImageMagick 库路径: ('%s', '%s')", libwand_path, libmagick_path)
             return True
-        logger.debug("未找到 ImageMagick 库路径")
+    logger.debug("未找到 ImageMagick 库路径")
     return False
+
+
+def _is_library_found(
+    library_path: str | None,
+) -> bool:
+    """判断 find_wand_library_paths() 生成的库路径是否可用
+
+    在 MAGICK_HOME 中拼接出的绝对路径不一定存在, 需要检查文件是否存在; ctypes.util.find_library() 返回的库名称不为 None 即表示已找到
+
+    Args:
+        library_path (str | None): 库路径或库名称
+    Returns:
+        bool: 库可用时返回 True
+    """
+    if library_path is None:
+        return False
+    if os.path.isabs(library_path):
+        return os.path.isfile(library_path)
+    return True
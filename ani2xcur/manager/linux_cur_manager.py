@@ -1,14 +1,16 @@
 """Linux 鼠标指针管理工具"""
 
+import os
 import stat
-from typing import TypedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from ani2xcur.manager.base import (
     CurrentCursorInfo,
     CurrentCursorInfoList,
+    CursorFilePair,
     CursorMap,
-    CURSOR_KEYS,
+    CURSOR_KEY_PAIRS,
     LocalCursor,
 )
 from ani2xcur.config_parse.linux import parse_desktop_entry_content
@@ -103,7 +105,8 @@ logger = get_logger(
 )
 
 
-class InstallLinuxSchemeInfo(TypedDict):
+@dataclass(slots=True)
+class InstallLinuxSchemeInfo:
     """Linux 鼠标指针安装信息"""
 
     scheme_name: str
@@ -113,7 +116,7 @@ class InstallLinuxSchemeInfo(TypedDict):
     """鼠标指针文件列表"""
 
     vars_dict: dict[str, str]
-    """INF 文件中的变量表"""
+    """DesktopEntry 文件中的变量表"""
 
     cursor_map: CursorMap
     """鼠标指针类型与对应的路径地图"""
@@ -131,35 +134,54 @@ def extract_scheme_info_from_desktop_entry(
     Raises:
         FileNotFoundError: 鼠标指针文件缺失时
     """
-    scheme_info: InstallLinuxSchemeInfo = {}
     desktop_entry_content = parse_desktop_entry_content(desktop_entry_file)
     scheme_name = desktop_entry_content["Icon Theme"]["Name"]
     cursor_path = desktop_entry_file.parent / "cursors"
-    if not cursor_path.is_dir():
-        raise FileNotFoundError(f"未找到 {cursor_path} 目录, 无法搜索已有的鼠标指针文件")
 
-    cursor_paths = get_file_list(
-        path=desktop_entry_file.parent / "cursors",
-        max_depth=0,
-    )
-    cursor_key_paths = {x.name: x for x in cursor_paths}
-    cursor_map: CursorMap = {}
+    # 单次遍历鼠标指针目录, 同时得到文件列表和文件名映射 (与 get_file_list 一致, 保留符号链接, 排除文件夹)
+    # 目录不存在时由 os.scandir 直接报错, 无需提前检查
+    try:
+        with os.scandir(cursor_path) as entries:
+            cursor_key_paths = {entry.name: Path(entry.path) for entry in entries if not entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"未找到 {cursor_path} 目录, 无法搜索已有的鼠标指针文件") from e
+    cursor_paths = list(cursor_key_paths.values())
     vars_dict = desktop_entry_content["Icon Theme"]
-    for win, linux in zip(CURSOR_KEYS["win"], CURSOR_KEYS["linux"]):
-        if linux in cursor_key_paths:
-            src = dst = cursor_key_paths[linux]
-        else:
-            src = dst = None
-        cursor_map[win] = {
-            "src_path": src,
-            "dst_path": dst,
-        }
-
-    scheme_info["scheme_name"] = scheme_name
-    scheme_info["cursor_paths"] = cursor_paths
-    scheme_info["vars_dict"] = vars_dict
-    scheme_info["cursor_map"] = cursor_map
-    return scheme_info
+    cursor_map: CursorMap = {}
+    for win, linux in CURSOR_KEY_PAIRS:
+        path = cursor_key_paths.get(linux)
+        cursor_map[win] = CursorFilePair(src_path=path, dst_path=path)
+
+    return InstallLinuxSchemeInfo(
+        scheme_name=scheme_name,
+        cursor_paths=cursor_paths,
+        vars_dict=vars_dict,
+        cursor_map=cursor_map,
+    )
+
+
+def _get_linux_cursor_scheme(
+    path: Path,
+) -> LocalCursor | None:
+    """获取图标目录中的鼠标指针信息
+
+    Args:
+        path (Path): 图标主题目录
+    Returns:
+        (LocalCursor | None): 鼠标指针信息, 当目录中缺少鼠标指针文件夹时返回 None
+    """
+    cursors_dir = path / "cursors"
+    if not cursors_dir.is_dir():
+        logger.debug("'%s' 缺少鼠标指针文件夹", path)
+        return None
+
+    logger.debug("获取 '%s' 鼠标指针的文件列表", path)
+    cursor_files = get_file_list(cursors_dir)
+    cursors: LocalCursor = {}
+    cursors["name"] = path.name
+    cursors["cursor_files"] = cursor_files
+    cursors["install_paths"] = [path]
+    return cursors
 
 
 def list_linux_cursors() -> CursorSchemesList:
@@ -175,18 +197,34 @@ def list_linux_cursors() -> CursorSchemesList:
     logger.debug("系统图标目录文件列表: %s", icon_system_paths)
     icon_paths = icon_user_paths + icon_system_paths
     for path in icon_paths:
-        cursors_dir = path / "cursors"
-        if not cursors_dir.is_dir():
-            logger.debug("'%s' 缺少鼠标指针文件夹", path)
-            continue
-
-        logger.debug("获取 '%s' 鼠标指针的文件列表", path)
-        cursor_files = get_file_list(cursors_dir)
-        cursors: LocalCursor = {}
-        cursors["name"] = path.name
-        cursors["cursor_files"] = cursor_files
-        cursors["install_paths"] = [path]
-        cursors_list.append(cursors)
+        cursors = _get_linux_cursor_scheme(path)
+        if cursors is not None:
+            cursors_list.append(cursors)
+
+    return cursors_list
+
+
+def find_linux_cursors(
+    cursor_name: str,
+) -> CursorSchemesList:
+    """查找 Linux 系统中指定名称的鼠标指针
+
+    直接检查用户图标目录和系统图标目录下的同名目录, 无需遍历全部鼠标指针的文件列表
+
+    Args:
+        cursor_name (str): 鼠标指针名称
+    Returns:
+        CursorSchemesList: 匹配的鼠标指针列表, 顺序与 `list_linux_cursors()` 一致, 未找到时为空列表
+    """
+    cursors_list: CursorSchemesList = []
+    # 鼠标指针名称只能对应图标目录下的一级目录
+    if cursor_name in ("", ".", "..") or "/" in cursor_name:
+        return cursors_list
+
+    for icons_path in (LINUX_USER_ICONS_PATH, LINUX_ICONS_PATH):
+        cursors = _get_linux_cursor_scheme((icons_path / cursor_name).absolute())
+        if cursors is not None:
+            cursors_list.append(cursors)
 
     return cursors_list
 
@@ -201,8 +239,7 @@ def set_linux_cursor_theme(
     Raises:
         ValueError: 鼠标指针不存在时
     """
-    cursors = [x["name"] for x in list_linux_cursors()]
-    if cursor_name not in cursors:
+    if not find_linux_cursors(cursor_name):
         logger.error("鼠标指针 '%s' 不存在", cursor_name)
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
@@ -362,8 +399,8 @@ def delete_linux_cursor(
         RuntimeError: 删除鼠标指针文件失败时
         ValueError: 指定的鼠标指针不存在时
     """
-    cursors = list_linux_cursors()
-    if cursor_name not in [x["name"] for x in cursors]:
+    cursors = find_linux_cursors(cursor_name)
+    if not cursors:
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
     logger.info("从 Linux 系统删除 '%s' 鼠标指针中", cursor_name)
@@ -411,13 +448,10 @@ def install_linux_cursor(
         FileNotFoundError: 鼠标指针中缺少 cursors 文件夹时
         RuntimeError:  复制鼠标指针文件夹发生失败时
     """
-    cursors_path = desktop_entry_file.parent / "cursors"
-    if not cursors_path.is_dir():
-        raise FileNotFoundError(f"在 {cursors_path} 中缺少 cursors 文件夹, 鼠标指针已损坏")
-
+    # 缺少 cursors 文件夹时由 extract_scheme_info_from_desktop_entry() 引发 FileNotFoundError
     scheme_info = extract_scheme_info_from_desktop_entry(desktop_entry_file)
     logger.debug("解析到的 DesktopEntry 配置: %s", scheme_info)
-    cursor_name = scheme_info["scheme_name"]
+    cursor_name = scheme_info.scheme_name
     src = desktop_entry_file.parent
     if cursor_install_path is not None:
         dst = cursor_install_path / cursor_name
@@ -452,15 +486,13 @@ def export_linux_cursor(
         ValueError: 鼠标指针在当前环境中不存在时
         RuntimeError: 导出鼠标指针文件发生失败时
     """
-    cursors = list_linux_cursors()
-    cursor_data = None
-    for data in cursors:
-        if data["name"] == cursor_name:
-            cursor_data = data
-
-    if cursor_data is None:
+    cursors = find_linux_cursors(cursor_name)
+    if not cursors:
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
+    # 与同名鼠标指针同时存在于用户和系统图标目录时的原有行为一致, 使用最后一个匹配项
+    cursor_data = cursors[-1]
+
     src = cursor_data["install_paths"][0]
     save_dir = output_path / cursor_name
 
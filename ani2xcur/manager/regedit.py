@@ -1,6 +1,7 @@
 """Windows 注册表操作工具"""
 
 import sys
+from typing import Iterable
 from enum import (
     IntFlag,
     Enum,
@@ -162,6 +163,34 @@ def registry_query_value(
             return None
 
 
+def registry_query_values(
+    names: Iterable[str],
+    sub_key: str,
+    key: RegistryRootKey | None = RegistryRootKey.CURRENT_USER,
+    access: RegistryAccess | None = RegistryAccess.READ,
+) -> dict[str, str | int | bytes | list[str] | None]:
+    """批量查询同一注册表键下的多个值, 注册表键只打开一次
+
+    Args:
+        names (Iterable[str]): 要查询的注册表的值名称
+        sub_key (str): 目标注册表子键路径 (不包含根键部分)
+        key (RegistryRootKey | None): 注册表根键枚举
+        access (RegistryAccess | None): 打开注册表键时使用的访问权限标志
+    Returns:
+        (dict[str, str | int | bytes | list[str] | None]):
+            键为注册表值名称, 值为查询到的注册表值数据, 当值不存在时为 `None`
+    """
+    values: dict[str, str | int | bytes | list[str] | None] = {}
+    query_value = winreg.QueryValueEx
+    with winreg.OpenKey(key, sub_key, 0, access) as reg:
+        for name in names:
+            try:
+                values[name] = query_value(reg, name)[0]
+            except FileNotFoundError:
+                values[name] = None
+    return values
+
+
 def registry_delete_value(
     name: str,
     sub_key: str,
@@ -220,15 +249,13 @@ def registry_enum_values(
     """
     values: dict[str, str | int | bytes | list[str] | None] = {}
 
+    enum_value = winreg.EnumValue
     with winreg.OpenKey(key, sub_key, 0, access) as reg:
-        index = 0
-        while True:
-            try:
-                name, value, _ = winreg.EnumValue(reg, index)
-                values[name] = value
-                index += 1
-            except OSError:
-                break
+        # 先获取值的数量, 避免依靠 EnumValue 越界抛出异常来结束枚举
+        _, value_count, _ = winreg.QueryInfoKey(reg)
+        for index in range(value_count):
+            name, value, _ = enum_value(reg, index)
+            values[name] = value
 
     return values
 
@@ -266,6 +293,33 @@ def registry_set_value(
         winreg.SetValueEx(reg, name, 0, reg_type, value)
 
 
+def registry_set_values(
+    items: Iterable[tuple[str, str | int | bytes | list[str], RegistryValueType]],
+    sub_key: str,
+    key: RegistryRootKey | None = RegistryRootKey.CURRENT_USER,
+    access: RegistryAccess | None = RegistryAccess.SET_VALUE,
+) -> None:
+    """批量设置或创建同一注册表键下的多个值, 注册表键只打开一次
+
+    Args:
+        items (Iterable[tuple[str, str | int | bytes | list[str], RegistryValueType]]):
+            要写入的 (注册表值名称, 数据内容, 注册表值类型) 列表
+
+        sub_key (str):
+            目标注册表子键路径
+
+        key (RegistryRootKey | None):
+            注册表根键枚举
+
+        access (RegistryAccess | None):
+            打开注册表键的访问权限
+    """
+    set_value = winreg.SetValueEx
+    with winreg.OpenKey(key, sub_key, 0, access) as reg:
+        for name, value, reg_type in items:
+            set_value(reg, name, 0, reg_type, value)
+
+
 def registry_path_exists(
     sub_key: str,
     key: RegistryRootKey | None = RegistryRootKey.CURRENT_USER,
@@ -312,7 +366,8 @@ def registry_create_path(
         access (RegistryAccess | None):
             打开/创建子键时的访问权限
     """
-    winreg.CreateKeyEx(key, sub_key, 0, access)
+    with winreg.CreateKeyEx(key, sub_key, 0, access) as _:
+        pass
 
 
 def registry_delete_path(
@@ -1,5 +1,6 @@
 """Windows 鼠标指针管理工具"""
 
+import os
 from typing import TypedDict
 from pathlib import Path
 
@@ -13,13 +14,14 @@ from ani2xcur.config import (
 from ani2xcur.file_operations.file_manager import (
     remove_files,
     copy_files,
-    get_real_path,
+    is_file_up_to_date,
 )
 from ani2xcur.config_parse.win import dict_to_inf_strings_format
 from ani2xcur.manager.base import (
     CURSOR_KEYS,
     CurrentCursorInfo,
     CurrentCursorInfoList,
+    CursorFilePair,
     CursorMap,
     LocalCursor,
     CursorSchemesList,
@@ -46,9 +48,47 @@ from ani2xcur.manager.regedit import (
     registry_set_value,
     registry_query_value,
 )
-from ani2xcur.utils import extend_list_to_length
+from ani2xcur.utils import (
+    extend_list_to_length,
+    lowercase_dict_keys,
+)
 from ani2xcur.manager.desktop_config.windows import expand_var_string
 
+QUOTE_REMOVAL_TABLE = str.maketrans("", "", "\"'")
+"""用于一次性删除字符串中单引号和双引号的转换表"""
+
+WINDOWS_CURSOR_SCHEME_INF_TEMPLATE = r"""
+[Version]
+signature="$CHICAGO$"
+
+
+[DefaultInstall]
+CopyFiles = Scheme.Cur
+AddReg    = Scheme.Reg,Wreg
+
+
+[DestinationDirs]
+Scheme.Cur = {destination_dirs}
+
+
+[Scheme.Reg]
+{scheme_reg}
+
+
+[Wreg]
+{wreg}
+
+
+[Scheme.Cur]
+{scheme_cur}
+
+
+[Strings]
+{strings}
+
+""".strip()
+"""导出鼠标指针时使用的 INF 文件模板"""
+
 logger = get_logger(
     name=LOGGER_NAME,
     level=LOGGER_LEVEL,
@@ -94,13 +134,38 @@ def extract_scheme_info_from_inf(
     def _expand_path(
         x: str,
     ) -> Path:
-        return Path(expand_var_string(x.replace('"', "").replace("'", ""), vars_dict))
-
+        return Path(expand_var_string(x.translate(QUOTE_REMOVAL_TABLE), lowercase_vars_dict, keys_lowercased=True))
+
+    def _find_real_file(
+        path: Path,
+    ) -> Path | None:
+        # 与 get_real_path() 的匹配规则一致 (不计大小写, 取第一个同名项), 但每个目录只读取一次,
+        # 避免对方案中的每个指针都重新遍历同一个目录, 不存在的文件也会被缓存
+        parent = path.parent
+        files = dir_files_cache.get(parent)
+        if files is None:
+            files = {}
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        name = entry.name.lower()
+                        if name not in files:
+                            files[name] = parent / entry.name if entry.is_file() else None
+            except OSError:
+                pass
+
+            dir_files_cache[parent] = files
+
+        return files.get(path.name.lower())
+
+    dir_files_cache: dict[Path, dict[str, Path | None]] = {}
     scheme_info: InstallWindowsSchemeInfo = {}
     cursor_map: CursorMap = {}
     inf_file_content = parse_inf_file_content(inf_file)
     scheme_reg = parse_scheme_reg_string(inf_file_content["Scheme.Reg"][0])
     vars_dict = inf_file_content["Strings"]
+    # 变量字典在展开每个路径时都会用到, 预先处理一次键名
+    lowercase_vars_dict = lowercase_dict_keys(vars_dict)
     scheme_name = vars_dict["SCHEME_NAME"]
     cursor_files = inf_file_content["Scheme.Cur"]
 
@@ -109,10 +174,12 @@ def extract_scheme_info_from_inf(
         raise ValueError(f"鼠标指针配置中的注册表配置不合法, 配置长度: {len(scheme_reg)}")
 
     # 将鼠标指针字段扩展到合适长度
-    cursor_reg_paths: list[str] = extend_list_to_length(scheme_reg[4].split(","), target_length=len(CURSOR_KEYS["win"]))
+    win_keys = CURSOR_KEYS["win"]
+    win_key_count = len(win_keys)
+    cursor_reg_paths: list[str] = extend_list_to_length(scheme_reg[4].split(","), target_length=win_key_count)
 
     # 检查 [Scheme.Reg] 中鼠标指针数量
-    if len(cursor_reg_paths) > len(CURSOR_KEYS["win"]):
+    if len(cursor_reg_paths) > win_key_count:
         raise ValueError(f"鼠标指针配置中指定的鼠标指针数量不合法, 指定的鼠标指针数量: {len(cursor_reg_paths)}")
 
     # 重新生成 [Scheme.Reg] 字段
@@ -128,35 +195,28 @@ def extract_scheme_info_from_inf(
     cursor_reg_paths = [x.replace(r"\\", "/").replace("\\", "/") for x in cursor_reg_paths]
     logger.debug("统一后的注册表路径列表: %s", cursor_reg_paths)
 
-    # 获取鼠标指针配置中指针文件的实际安装路径列表
+    # 获取鼠标指针配置中指针文件的实际安装路径列表, 并记录鼠标指针原文件路径和安装到的实际路径
+    # 每个路径只展开一次变量, 同时用于两份结果
     # 为什么要大小写不敏感啊, 呜呜呜
     default_dst_cursor_paths: list[Path] = []
-    for x in cursor_reg_paths:
-        logger.debug("尝试查找对应的鼠标指针文件: '%s'", x)
-        p = get_real_path(_expand_path(x))
-        if p.is_file():
+    for key, value in zip(win_keys, cursor_reg_paths):
+        if value.strip() == "":
+            cursor_map[key] = CursorFilePair(src_path=None, dst_path=None)
+            continue
+
+        dst_path = _expand_path(value)
+        logger.debug("尝试查找对应的鼠标指针文件: '%s'", value)
+        p = _find_real_file(dst_path)
+        if p is not None:
             logger.debug("匹配到鼠标指针文件: '%s'", p)
             default_dst_cursor_paths.append(p)
-            continue
 
-    # 记录鼠标指针原文件路径和安装到的实际路径, 并记录成字典
-    for key, value in zip(CURSOR_KEYS["win"], cursor_reg_paths):
-        if value.strip() != "":
-            dst_path = _expand_path(value)
-            src_path = get_real_path(inf_file.parent / dst_path.name)  # 大小写不敏感好坑
-            if not src_path.is_file():
-                src_path = None
-        else:
-            dst_path = None
-            src_path = None
+        src_path = _find_real_file(inf_file.parent / dst_path.name)  # 大小写不敏感好坑
 
-        cursor_map[key] = {
-            "dst_path": dst_path,
-            "src_path": src_path,
-        }
+        cursor_map[key] = CursorFilePair(src_path=src_path, dst_path=dst_path)
 
-    # 鼠标指针原文件列表
-    cursor_paths = [inf_file.parent / x for x in cursor_files if (inf_file.parent / x).is_file()]
+    # 鼠标指针原文件列表, 与 INF 文件同目录的文件列表已在上面读取过, 直接复用
+    cursor_paths = [p for p in (_find_real_file(inf_file.parent / x) for x in cursor_files) if p is not None]
 
     # 生成字典
     scheme_info["scheme_name"] = scheme_name
@@ -180,35 +240,29 @@ def parse_scheme_reg_string(
         list[str]: 解析后的字符串列表
     """
     result: list[str] = []
-    current = ""
+    # 使用列表收集字符并在分割时统一拼接, 避免逐字符拼接字符串
+    current: list[str] = []
     in_single_quotes = False
     in_double_quotes = False
-    i = 0
-
-    while i < len(scheme_reg_string):
-        char = scheme_reg_string[i]
 
+    for char in scheme_reg_string:
         if char == '"' and not in_single_quotes:
             # 切换双引号状态 (仅当不在单引号内)
             in_double_quotes = not in_double_quotes
-            i += 1
         elif char == "'" and not in_double_quotes:
             # 切换单引号状态 (仅当不在双引号内)
             in_single_quotes = not in_single_quotes
-            i += 1
         elif char == "," and not in_single_quotes and not in_double_quotes:
             # 只有在非引号状态下遇到逗号才分割
-            result.append(current)
-            current = ""
-            i += 1
+            result.append("".join(current))
+            current.clear()
         else:
             # 添加字符到当前项
-            current += char
-            i += 1
+            current.append(char)
 
     # 添加最后一项
     if current or scheme_reg_string.endswith(","):
-        result.append(current)
+        result.append("".join(current))
 
     # 去除每项首尾的引号 (如果存在)
     cleaned_result: list[str] = []
@@ -257,9 +311,36 @@ def list_windows_cursors() -> CursorSchemesList:
         key=RegistryRootKey.CURRENT_USER,
         access=RegistryAccess.READ,
     )
+    return _build_windows_cursors_list(schemes)
+
+
+def _build_windows_cursors_list(
+    schemes: dict[str, str],
+) -> CursorSchemesList:
+    """根据注册表中的鼠标指针方案生成鼠标指针列表
+
+    Args:
+        schemes (dict[str, str]): 鼠标指针方案名称与方案值的字典
+    Returns:
+        CursorSchemesList: 本地已安装的鼠标指针列表
+    """
     cursors_list: CursorSchemesList = []
+    # 各方案常共用同一批指针文件, 按解析后的路径缓存文件检查结果, 每个路径只检查一次
+    is_file_cache: dict[str, bool] = {}
     for name, data in schemes.items():
-        cursor_files = [Path(expand_var_string(x)) for x in data.split(",") if x.strip() != "" and Path(expand_var_string(x)).is_file()]
+        cursor_files: list[Path] = []
+        for x in data.split(","):
+            if x.strip() == "":
+                continue
+
+            resolved = expand_var_string(x)
+            is_file = is_file_cache.get(resolved)
+            if is_file is None:
+                is_file = is_file_cache[resolved] = os.path.isfile(resolved)
+
+            if is_file:
+                cursor_files.append(Path(resolved))
+
         install_paths = list({x.parent for x in cursor_files})
         cursors: LocalCursor = {}
         cursors["name"] = name
@@ -270,6 +351,36 @@ def list_windows_cursors() -> CursorSchemesList:
     return cursors_list
 
 
+def has_windows_cursor_scheme(
+    cursor_name: str,
+) -> bool:
+    """检查 Windows 系统中是否存在指定的鼠标指针方案
+
+    先直接查询方案对应的注册表值, 无需检查指针文件; 注册表值名称不区分大小写,
+    查询到后再枚举方案名称确认大小写完全一致
+
+    Args:
+        cursor_name (str): 鼠标指针方案名称
+    Returns:
+        bool: 鼠标指针方案存在时返回 True
+    """
+    scheme_data = registry_query_value(
+        name=cursor_name,
+        sub_key=WINDOWS_CURSOR_CURSORS_SCHEME_PATH,
+        key=RegistryRootKey.CURRENT_USER,
+        access=RegistryAccess.READ,
+    )
+    if scheme_data is None:
+        return False
+
+    schemes = registry_enum_values(
+        sub_key=WINDOWS_CURSOR_CURSORS_SCHEME_PATH,
+        key=RegistryRootKey.CURRENT_USER,
+        access=RegistryAccess.READ,
+    )
+    return cursor_name in schemes
+
+
 def set_windows_cursor_theme(
     cursor_name: str,
 ) -> None:
@@ -280,8 +391,7 @@ def set_windows_cursor_theme(
     Raises:
         ValueError: 鼠标指针不存在时
     """
-    cursors = [x["name"] for x in list_windows_cursors()]
-    if cursor_name not in cursors:
+    if not has_windows_cursor_scheme(cursor_name):
         logger.error("鼠标指针 '%s 不存在", cursor_name)
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
@@ -339,32 +449,39 @@ def delete_windows_cursor(
         RuntimeError: 删除鼠标指针文件失败时
         ValueError: 指定的鼠标指针不存在或者正在被使用时
     """
-    cursors = list_windows_cursors()
-    if cursor_name not in [x["name"] for x in cursors]:
+    # 方案列表只枚举一次, 同时用于检查方案是否存在和统计其他方案使用的文件
+    schemes = registry_enum_values(
+        sub_key=WINDOWS_CURSOR_CURSORS_SCHEME_PATH,
+        key=RegistryRootKey.CURRENT_USER,
+        access=RegistryAccess.READ,
+    )
+    if cursor_name not in schemes:
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
     if cursor_name == get_windows_cursor_theme():
         raise ValueError(f"鼠标指针 {cursor_name} 正在被使用, 无法删除")
 
+    cursors = _build_windows_cursors_list(schemes)
+
     logger.info("从 Windows 系统删除 '%s' 鼠标指针中", cursor_name)
 
     # 统计需要删除和保留的鼠标指针文件
-    delete_file_paths: list[Path] = []
-    preserve_file_paths: list[Path] = []
-    delete_parent_paths: list[Path] = []
+    # 使用字典去重并保持原有顺序, 同一指针文件可能被方案中的多个指针引用
+    delete_file_paths: dict[Path, None] = {}
+    preserve_file_paths: set[Path] = set()
+    delete_parent_paths: dict[Path, None] = {}
     for scheme in cursors:
         if cursor_name == scheme["name"]:
-            delete_file_paths += scheme["cursor_files"]
-            delete_parent_paths += scheme["install_paths"]
+            delete_file_paths.update(dict.fromkeys(scheme["cursor_files"]))
+            delete_parent_paths.update(dict.fromkeys(scheme["install_paths"]))
         else:
-            preserve_file_paths += scheme["cursor_files"]
+            preserve_file_paths.update(scheme["cursor_files"])
 
     # 计算需要删除的文件
-    preserve_file_paths_set = set(preserve_file_paths)
-    need_delete_file_paths = [x for x in delete_file_paths if x not in preserve_file_paths_set]
+    need_delete_file_paths = [x for x in delete_file_paths if x not in preserve_file_paths]
 
-    logger.debug("%s 所属的鼠标指针文件列表: %s", cursor_name, delete_file_paths)
-    logger.debug("%s 所属的鼠标指针安装目录列表: %s", cursor_name, delete_parent_paths)
+    logger.debug("%s 所属的鼠标指针文件列表: %s", cursor_name, list(delete_file_paths))
+    logger.debug("%s 所属的鼠标指针安装目录列表: %s", cursor_name, list(delete_parent_paths))
     logger.debug("%s 需要删除的鼠标指针文件列表: %s", cursor_name, need_delete_file_paths)
 
     # 清理鼠标指针文件
@@ -437,9 +554,9 @@ def install_windows_cursor(
         # 使用自定义安装路径
         install_path = cursor_install_path
         for _, cursor_pair in scheme_info["cursor_map"].items():
-            src = cursor_pair["src_path"]
+            src = cursor_pair.src_path
             if src is not None:
-                dst = cursor_install_path / cursor_name / cursor_pair["dst_path"].name
+                dst = cursor_install_path / cursor_name / cursor_pair.dst_path.name
                 cursor_paths_in_reg.append(str(dst))
                 copy_paths.append((src, dst))
             else:
@@ -449,10 +566,10 @@ def install_windows_cursor(
         reg_scheme_value = ",".join(cursor_paths_in_reg)
     else:
         for _, cursor_pair in scheme_info["cursor_map"].items():
-            src = cursor_pair["src_path"]
+            src = cursor_pair.src_path
             if src is not None:
-                install_path = cursor_pair["dst_path"].parent
-                dst = cursor_pair["dst_path"]
+                install_path = cursor_pair.dst_path.parent
+                dst = cursor_pair.dst_path
                 copy_paths.append((src, dst))
 
         # 生成需要写入注册表的方案对应值, 使用原始值
@@ -462,6 +579,11 @@ def install_windows_cursor(
 
     # 复制鼠标指针文件
     for src, dst in copy_paths:
+        # 重复安装时跳过已存在且未变化的鼠标指针文件
+        if is_file_up_to_date(src, dst):
+            logger.debug("鼠标指针文件 '%s' 已存在且未变化, 跳过复制", dst)
+            continue
+
         try:
             dst.parent.mkdir(parents=True, exist_ok=True)
             copy_files(src, dst)
@@ -503,13 +625,7 @@ def export_windows_cursor(
     Raises:
         ValueError: 鼠标指针在当前环境中不存在时
     """
-    cursors = list_windows_cursors()
-    cursor_data = None
-    for data in cursors:
-        if data["name"] == cursor_name:
-            cursor_data = data
-
-    if cursor_data is None:
+    if not has_windows_cursor_scheme(cursor_name):
         raise ValueError(f"鼠标指针 {cursor_name} 不存在")
 
     config_dict = generate_cursor_scheme_config(
@@ -558,43 +674,13 @@ def generate_cursor_scheme_inf_string(
     Returns:
         str: 鼠标指针的 INF 字符串
     """
-    inf_content = r"""
-[Version]
-signature="$CHICAGO$"
-
-
-[DefaultInstall]
-CopyFiles = Scheme.Cur
-AddReg    = Scheme.Reg,Wreg
-
-
-[DestinationDirs]
-Scheme.Cur = {{DESTINATION_DIRS}}
-
-
-[Scheme.Reg]
-{{SCHEME_REG}}
-
-
-[Wreg]
-{{WREG}}
-
-
-[Scheme.Cur]
-{{SCHEME_CUR}}
-
-
-[Strings]
-{{STRING_VARS}}
-
-""".strip()
-
-    return (
-        inf_content.replace(r"{{DESTINATION_DIRS}}", destination_dirs.strip())
-        .replace(r"{{WREG}}", wreg.strip())
-        .replace(r"{{SCHEME_REG}}", scheme_reg.strip())
-        .replace(r"{{SCHEME_CUR}}", scheme_cur.strip())
-        .replace(r"{{STRING_VARS}}", strings.strip())
+    # 一次性填充所有字段, 避免逐个替换时重复复制整个字符串, 且字段内容不会被后续替换误改
+    return WINDOWS_CURSOR_SCHEME_INF_TEMPLATE.format(
+        destination_dirs=destination_dirs.strip(),
+        wreg=wreg.strip(),
+        scheme_reg=scheme_reg.strip(),
+        scheme_cur=scheme_cur.strip(),
+        strings=strings.strip(),
     )
 
 
@@ -627,54 +713,66 @@ def generate_cursor_scheme_config(
     )
 
     cursor_paths: list[Path] = []  # 用于导出的路径列表
+    cursor_file_names: list[str] = []  # [Scheme.Cur] 部分
     paths_to_reg: list[str] = []  # [Scheme.Reg] 部分
     strings: dict[str, str] = {}  # [Strings] 部分
     wreg_list: list[str] = []  # [Wreg] 部分
     wreg_list.append(r'HKCU,"Control Panel\Cursors",,0x00020000,"%SCHEME_NAME%"')
     strings["SCHEME_NAME"] = cursor_name
 
-    # 将路径字符串解释成实际鼠标指针文件路径
-    raw_paths: list[str] = extend_list_to_length(cursor_paths_in_reg.split(","), target_length=len(CURSOR_KEYS["win"]))[: len(CURSOR_KEYS["win"])]
-    for key, origin_path in zip(CURSOR_KEYS["win"], raw_paths):
-        path = Path(expand_var_string(origin_path)) if origin_path.strip() != "" and Path(expand_var_string(origin_path)).is_file() else None
-        if path is not None:
-            cursor_paths.append(path)
+    # 将路径字符串解释成实际鼠标指针文件路径, 多出的路径由 zip() 截断
+    win_keys = CURSOR_KEYS["win"]
+    raw_paths: list[str] = extend_list_to_length(cursor_paths_in_reg.split(","), target_length=len(win_keys))
+    # 同一指针文件可能被多个指针引用, 按解析后的路径缓存文件检查结果
+    is_file_cache: dict[str, bool] = {}
+    for key, origin_path in zip(win_keys, raw_paths):
+        if origin_path.strip() == "":
+            paths_to_reg.append("")
+            continue
+
+        resolved = expand_var_string(origin_path)
+        is_file = is_file_cache.get(resolved)
+        if is_file is None:
+            is_file = is_file_cache[resolved] = os.path.isfile(resolved)
+
+        if not is_file:
+            paths_to_reg.append("")
+            continue
 
-        path_in_reg = ""
-        if custom_install_path is not None and path is not None:
+        path = Path(resolved)
+        file_name = path.name
+        cursor_paths.append(path)
+        cursor_file_names.append(file_name)
+
+        if custom_install_path is not None:
             # 使用自定义安装路径
             path_in_reg = str(custom_install_path / cursor_name / f"%{key}%")
-        elif path is not None:
+        else:
             # 使用默认安装路径
             path_in_reg = rf"%10%\%CUR_DIR%\%{key}%"
 
         paths_to_reg.append(path_in_reg)
-        if path_in_reg != "":
-            strings[key] = path.name
-            wreg_list.append(rf'HKCU,"Control Panel\Cursors",{key},0x00020000,"{path_in_reg}"')
+        strings[key] = file_name
+        wreg_list.append(rf'HKCU,"Control Panel\Cursors",{key},0x00020000,"{path_in_reg}"')
 
     wreg_list.append(r'HKLM,"SOFTWARE\Microsoft\Windows\CurrentVersion\Runonce\Setup\","",,"rundll32.exe shell32.dll,Control_RunDLL main.cpl @0"')
     wreg = "\n".join(wreg_list)
 
-    # 配置 [DistinationDirs] 字段和部分 [Strings] 字段
+    # 配置 [DistinationDirs] 字段, 部分 [Strings] 字段和 [Scheme.Reg] 字段
+    paths_to_reg_string = ",".join(paths_to_reg)
     if custom_install_path is not None:
         # 使用自定义安装路径
         custom_path = str(custom_install_path / cursor_name)
         strings["CUR_DIR"] = custom_path
         destination_dirs = r'-1,"%CUR_DIR%"'
+        scheme_reg = rf'HKCU,"Control Panel\Cursors\Schemes","%SCHEME_NAME%",,"{paths_to_reg_string}"'
     else:
         strings["CUR_DIR"] = rf"Cursors\{cursor_name}"
         destination_dirs = r'10,"%CUR_DIR%"'
-
-    # 配置 [Scheme.Reg] 字段
-    paths_to_reg_string = ",".join(paths_to_reg)
-    if custom_install_path is not None:
-        scheme_reg = rf'HKCU,"Control Panel\Cursors\Schemes","%SCHEME_NAME%",,"{paths_to_reg_string}"'
-    else:
         scheme_reg = rf'HKCU,"Control Panel\Cursors\Schemes","%SCHEME_NAME%",0x00020000,"{paths_to_reg_string}"'
 
     # 配置 [Scheme.Cur] 字段
-    scheme_cur = "\n".join([f'"{x.name}"' for x in cursor_paths])
+    scheme_cur = "\n".join([f'"{x}"' for x in cursor_file_names])
 
     # 打包参数
     config_dict["cursor_src_file"] = cursor_paths
@@ -22,12 +22,14 @@ WINDOWS_ENV_VALUE_REGESTRY_PATH_USER = [RegistryRootKey.CURRENT_USER, "Environme
 def add_path_to_env_path(
     new_path: str,
     dtype: Literal["user", "system"] | None = "user",
+    broadcast: bool = True,
 ) -> bool:
     """将路径添加到 PATH 环境变量
 
     Args:
         new_path (str): 要添加到 PATH 环境变量的路径
         dtype (Literal["user", "system"] | None): 要添加路径的环境变量类型
+        broadcast (bool): 修改后是否广播环境变量更改消息, 连续修改多个环境变量时可在最后统一广播
     Returns:
         bool: 当添加成功时返回 True, 已经存在时则返回 False
     Raises:
@@ -59,7 +61,8 @@ def add_path_to_env_path(
         key=key,
         access=RegistryAccess.WRITE,
     )
-    broadcast_settings_change()
+    if broadcast:
+        broadcast_settings_change()
     return True
 
 
@@ -67,6 +70,7 @@ def add_val_to_env(
     name: str,
     value: str,
     dtype: Literal["user", "system"] | None = "user",
+    broadcast: bool = True,
 ) -> None:
     """将变量添加到环境变量
 
@@ -74,6 +78,7 @@ def add_val_to_env(
         name (str): 环境变量的名称
         value (str): 环境变量的值
         dtype (Literal["user", "system"] | None): 要添加路径的环境变量类型
+        broadcast (bool): 修改后是否广播环境变量更改消息, 连续修改多个环境变量时可在最后统一广播
     Raises:
         ValueError: 使用未知的环境变量类型时
     """
@@ -92,18 +97,21 @@ def add_val_to_env(
         key=key,
         access=RegistryAccess.WRITE,
     )
-    broadcast_settings_change()
+    if broadcast:
+        broadcast_settings_change()
 
 
 def delete_path_from_env_path(
     key_path: str,
     dtype: Literal["user", "system"] | None = "user",
+    broadcast: bool = True,
 ) -> bool:
     """将指定路径从 PATH 环境变量中删除
 
     Args:
         key_path (str): 要从 PATH 环境变量删除的路径
         dtype (Literal["user", "system"] | None): 要删除路径的环境变量类型
+        broadcast (bool): 修改后是否广播环境变量更改消息, 连续修改多个环境变量时可在最后统一广播
     Raises:
         ValueError: 使用未知的环境变量类型时
     """
@@ -129,18 +137,21 @@ def delete_path_from_env_path(
         key=key,
         access=RegistryAccess.WRITE,
     )
-    broadcast_settings_change()
+    if broadcast:
+        broadcast_settings_change()
 
 
 def delete_val_from_env(
     name: str,
     dtype: Literal["user", "system"] | None = "user",
+    broadcast: bool = True,
 ) -> None:
     """将变量从环境变量中删除
 
     Args:
         name (str): 环境变量的名称
         dtype (Literal["user", "system"] | None): 要删除变量的环境变量类型
+        broadcast (bool): 修改后是否广播环境变量更改消息, 连续修改多个环境变量时可在最后统一广播
     Raises:
         ValueError: 使用未知的环境变量类型时
     """
@@ -152,4 +163,5 @@ def delete_val_from_env(
         raise ValueError(f"未知的环境变量类型: {dtype}")
 
     registry_delete_value(name=name, sub_key=sub_key, key=key, access=RegistryAccess.WRITE)
-    broadcast_settings_change()
+    if broadcast:
+        broadcast_settings_change()
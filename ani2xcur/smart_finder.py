@@ -1,14 +1,22 @@
 """鼠标指针配置文件智能搜索"""
 
+import os
+import hashlib
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from ani2xcur.config_parse.win import parse_inf_file_content
 from ani2xcur.config_parse.linux import parse_desktop_entry_content
 from ani2xcur.file_operations.archive_manager import (
+    SUPPORTED_ARCHIVE_FORMAT,
+    archive_may_contain,
     is_supported_archive_format,
     extract_archive,
 )
-from ani2xcur.file_operations.file_manager import get_file_list
+from ani2xcur.file_operations.file_manager import (
+    find_first,
+    iter_file_list,
+)
 from ani2xcur.utils import (
     generate_random_string,
     is_http_or_https,
@@ -19,6 +27,7 @@ from ani2xcur.config import (
     LOGGER_COLOR,
     LOGGER_LEVEL,
     LOGGER_NAME,
+    ARCHIVE_CACHE_PATH,
 )
 
 logger = get_logger(
@@ -27,6 +36,156 @@ logger = get_logger(
     color=LOGGER_COLOR,
 )
 
+_ARCHIVE_SUFFIXES = tuple(SUPPORTED_ARCHIVE_FORMAT)
+"""压缩包后缀元组, 用于 str.endswith 快速匹配"""
+
+
+def _extract_for_search(
+    archive_path: Path,
+    temp_dir: Path,
+    use_cache: bool = True,
+) -> Path:
+    """解压压缩包用于搜索, 设置了持久化缓存目录时复用该压缩包上次的解压结果
+
+    Args:
+        archive_path (Path): 压缩包路径
+        temp_dir (Path): 临时文件夹, 未启用缓存时解压到该文件夹中
+        use_cache (bool): 是否使用持久化缓存目录
+    Returns:
+        Path: 解压出的文件夹路径
+    """
+    if ARCHIVE_CACHE_PATH is None or not use_cache:
+        extract_path = temp_dir / generate_random_string()
+        extract_archive(
+            archive_path=archive_path,
+            extract_to=extract_path,
+        )
+        return extract_path
+
+    # 以压缩包路径, 修改时间和大小区分缓存, 压缩包被修改后会重新解压
+    archive_stat = archive_path.stat()
+    path_hash = hashlib.sha256(str(archive_path).encode("utf-8")).hexdigest()[:16]
+    cache_path = ARCHIVE_CACHE_PATH / f"{path_hash}-{archive_stat.st_mtime_ns}-{archive_stat.st_size}"
+    if cache_path.is_dir():
+        logger.debug("使用压缩包的解压缓存: '%s' -> '%s'", archive_path, cache_path)
+        return cache_path
+
+    # 先解压到缓存目录中的临时文件夹, 完成后再移动到缓存路径, 避免中断时留下不完整的缓存
+    ARCHIVE_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    with TemporaryDirectory(dir=ARCHIVE_CACHE_PATH, prefix=".ani2xcur-") as extract_temp_dir:
+        extract_path = Path(extract_temp_dir) / "extract"
+        extract_archive(
+            archive_path=archive_path,
+            extract_to=extract_path,
+        )
+        try:
+            os.replace(extract_path, cache_path)
+        except OSError:
+            # 其他进程已写入相同的缓存
+            if not cache_path.is_dir():
+                raise
+
+    return cache_path
+
+
+def _is_archive_name(
+    name: str,
+) -> bool:
+    """判断文件名是否为支持解压的压缩包
+
+    Args:
+        name (str): 文件名
+    Returns:
+        bool: 为支持的压缩包时返回 True
+    """
+    return name.endswith(_ARCHIVE_SUFFIXES)
+
+
+def _is_desktop_entry_name(
+    name: str,
+) -> bool:
+    """判断文件名是否可能为 DesktopEntry 文件
+
+    Args:
+        name (str): 文件名
+    Returns:
+        bool: 文件名符合时返回 True
+    """
+    return name.lower().endswith(".theme")
+
+
+def _is_inf_name(
+    name: str,
+) -> bool:
+    """判断文件名是否可能为 INF 文件
+
+    Args:
+        name (str): 文件名
+    Returns:
+        bool: 文件名符合时返回 True
+    """
+    return name.lower().endswith(".inf")
+
+
+def _is_desktop_entry_search_target(
+    name: str,
+) -> bool:
+    """判断压缩包中的文件名是否值得解压搜索 (DesktopEntry 文件或嵌套的压缩包)
+
+    Args:
+        name (str): 文件名
+    Returns:
+        bool: 需要解压搜索时返回 True
+    """
+    return _is_desktop_entry_name(name) or _is_archive_name(name)
+
+
+def _is_inf_search_target(
+    name: str,
+) -> bool:
+    """判断压缩包中的文件名是否值得解压搜索 (INF 文件或嵌套的压缩包)
+
+    Args:
+        name (str): 文件名
+    Returns:
+        bool: 需要解压搜索时返回 True
+    """
+    return _is_inf_name(name) or _is_archive_name(name)
+
+
+def _is_valid_desktop_entry_file(
+    path: Path,
+) -> bool:
+    """检查 DesktopEntry 文件是否可以正常解析
+
+    Args:
+        path (Path): DesktopEntry 文件路径
+    Returns:
+        bool: 解析成功时返回 True
+    """
+    try:
+        _ = parse_desktop_entry_content(path)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_valid_inf_file(
+    path: Path,
+) -> bool:
+    """检查 INF 文件是否可以正常解析
+
+    Args:
+        path (Path): INF 文件路径
+    Returns:
+        bool: 解析成功时返回 True
+    """
+    try:
+        _ = parse_inf_file_content(path)
+        return True
+    except ValueError:
+        return False
+
 
 def find_desktop_entry_file(
     input_file: Path | str,
@@ -79,10 +238,14 @@ def find_desktop_entry_file(
                 return None
 
             logger.debug("从 '%s' 下载成功, 准备解压搜索: '%s'", input_file, download_file)
-            extract_path = temp_dir / generate_random_string()
-            extract_archive(
+            if not archive_may_contain(download_file, _is_desktop_entry_search_target):
+                logger.debug("压缩包中不含 DesktopEntry 文件, 跳过解压: '%s'", download_file)
+                return None
+
+            extract_path = _extract_for_search(
                 archive_path=download_file,
-                extract_to=extract_path,
+                temp_dir=temp_dir,
+                use_cache=False,  # 每次下载的文件路径不同, 缓存无法命中
             )
             # 递归调用 (标记 is_toplevel=False)
             return find_desktop_entry_file(
@@ -108,21 +271,23 @@ def find_desktop_entry_file(
     visited.add(abs_path)
 
     # 验证 DesktopEntry 文件完整性
-    if abs_path.is_file() and abs_path.name.lower().endswith(".theme"):
-        try:
-            _ = parse_desktop_entry_content(abs_path)
-            logger.debug("搜索到 DesktopEntry 文件路径: '%s'", abs_path)
-            return abs_path
-        except ValueError:
+    if abs_path.is_file() and _is_desktop_entry_name(abs_path.name):
+        if not _is_valid_desktop_entry_file(abs_path):
             return None
+        logger.debug("搜索到 DesktopEntry 文件路径: '%s'", abs_path)
+        return abs_path
 
     # 文件为压缩包时则尝试解压并遍历解压的文件夹
     if is_supported_archive_format(abs_path):
+        # 可以读取成员列表的压缩包不含目标文件时, 无需解压整个压缩包
+        if not archive_may_contain(abs_path, _is_desktop_entry_search_target):
+            logger.debug("压缩包中不含 DesktopEntry 文件, 跳过解压: '%s'", abs_path)
+            return None
+
         logger.debug("检测到压缩包，准备解压: '%s'", abs_path)
-        extract_path = temp_dir / generate_random_string()
-        extract_archive(
+        extract_path = _extract_for_search(
             archive_path=abs_path,
-            extract_to=extract_path,
+            temp_dir=temp_dir,
         )
         logger.debug("搜索解压出的文件夹: '%s'", extract_path)
         # 递归调用 (标记 is_toplevel=False)
@@ -135,19 +300,35 @@ def find_desktop_entry_file(
         )
 
     # 如果是文件夹则尝试遍历文件夹中的文件
-    if abs_path.is_dir():
+    if abs_path.is_dir() and depth > 0:
         logger.debug("搜索 '%s' 文件夹", abs_path)
-        # 获取下级文件列表
-        paths = get_file_list(
+        # 广度优先搜索, 优先找到层级最浅的 DesktopEntry 文件, 找到后立即停止遍历
+        file = find_first(
             path=abs_path,
-            max_depth=0,
-            include_dirs=True,
+            predicate=_is_valid_desktop_entry_file,
+            max_depth=depth - 1,
+            name_predicate=_is_desktop_entry_name,
+            follow_symlinks=True,
+        )
+        if file is not None:
+            file = file.resolve()
+            logger.debug("搜索到 DesktopEntry 文件路径: '%s'", file)
+            return file
+
+        # 文件夹中没有可用的 DesktopEntry 文件时, 继续搜索其中的压缩包
+        paths = iter_file_list(
+            path=abs_path,
+            max_depth=depth - 1,
+            name_predicate=_is_archive_name,
+            follow_symlinks=True,
         )
         for path in paths:
+            # 压缩包所处的层级同样消耗搜索深度
+            level = len(path.relative_to(abs_path).parts) - 1
             file = find_desktop_entry_file(
                 input_file=path,
                 temp_dir=temp_dir,
-                depth=depth - 1,
+                depth=depth - 1 - level,
                 visited=visited,
                 is_toplevel=False,
             )
@@ -204,10 +385,14 @@ def find_inf_file(
                 return None
 
             logger.debug("从 '%s' 下载成功, 准备解压搜索: '%s'", input_file, download_file)
-            extract_path = temp_dir / generate_random_string()
-            extract_archive(
+            if not archive_may_contain(download_file, _is_inf_search_target):
+                logger.debug("压缩包中不含 INF 文件, 跳过解压: '%s'", download_file)
+                return None
+
+            extract_path = _extract_for_search(
                 archive_path=download_file,
-                extract_to=extract_path,
+                temp_dir=temp_dir,
+                use_cache=False,  # 每次下载的文件路径不同, 缓存无法命中
             )
             # 递归调用 (标记 is_toplevel=False)
             return find_inf_file(
@@ -239,21 +424,23 @@ def find_inf_file(
     visited.add(abs_path)
 
     # 验证 INF 文件完整性
-    if abs_path.is_file() and abs_path.name.lower().endswith(".inf"):
-        try:
-            _ = parse_inf_file_content(abs_path)
-            logger.debug("搜索到 INF 文件路径: '%s'", abs_path)
-            return abs_path
-        except ValueError:
+    if abs_path.is_file() and _is_inf_name(abs_path.name):
+        if not _is_valid_inf_file(abs_path):
             return None
+        logger.debug("搜索到 INF 文件路径: '%s'", abs_path)
+        return abs_path
 
     # 文件为压缩包时则尝试解压并遍历解压的文件夹
     if is_supported_archive_format(abs_path):
+        # 可以读取成员列表的压缩包不含目标文件时, 无需解压整个压缩包
+        if not archive_may_contain(abs_path, _is_inf_search_target):
+            logger.debug("压缩包中不含 INF 文件, 跳过解压: '%s'", abs_path)
+            return None
+
         logger.debug("检测到压缩包，准备解压: '%s'", abs_path)
-        extract_path = temp_dir / generate_random_string()
-        extract_archive(
+        extract_path = _extract_for_search(
             archive_path=abs_path,
-            extract_to=extract_path,
+            temp_dir=temp_dir,
         )
         logger.debug("搜索解压出的文件夹: '%s'", extract_path)
         # 递归调用 (标记 is_toplevel=False)
@@ -266,19 +453,35 @@ def find_inf_file(
         )
 
     # 如果是文件夹则尝试遍历文件夹中的文件
-    if abs_path.is_dir():
+    if abs_path.is_dir() and depth > 0:
         logger.debug("搜索 '%s' 文件夹", abs_path)
-        # 获取下级文件列表
-        paths = get_file_list(
+        # 广度优先搜索, 优先找到层级最浅的 INF 文件, 找到后立即停止遍历
+        file = find_first(
+            path=abs_path,
+            predicate=_is_valid_inf_file,
+            max_depth=depth - 1,
+            name_predicate=_is_inf_name,
+            follow_symlinks=True,
+        )
+        if file is not None:
+            file = file.resolve()
+            logger.debug("搜索到 INF 文件路径: '%s'", file)
+            return file
+
+        # 文件夹中没有可用的 INF 文件时, 继续搜索其中的压缩包
+        paths = iter_file_list(
             path=abs_path,
-            max_depth=0,
-            include_dirs=True,
+            max_depth=depth - 1,
+            name_predicate=_is_archive_name,
+            follow_symlinks=True,
         )
         for path in paths:
+            # 压缩包所处的层级同样消耗搜索深度
+            level = len(path.relative_to(abs_path).parts) - 1
             file = find_inf_file(
                 input_file=path,
                 temp_dir=temp_dir,
-                depth=depth - 1,
+                depth=depth - 1 - level,
                 visited=visited,
                 is_toplevel=False,
             )